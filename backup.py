@@ -1,21 +1,72 @@
 import os
 import shutil
 import datetime
-import glob
 import argparse
 import sys
 import time
 import json
 import subprocess
+import sqlite3
+import tarfile
 import threading
 import tempfile
 import hashlib
 import errno
+import fnmatch
+import copy
+import functools
+import itertools
+import concurrent.futures
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 import ctypes
 from ctypes import wintypes
 
+# Optional BLAKE3 support: the 'blake3' package dispatches to SIMD
+# (AVX2/AVX-512) internally and can hash memory-mapped files without
+# Python-level chunk loops. Fall back to hashlib.sha256 if unavailable.
+try:
+    from blake3 import blake3 as _blake3
+except ImportError:
+    _blake3 = None
+
+# Optional orjson support: C-implemented JSON encoding for config and
+# backup-metadata writes. Falls back to the stdlib json module.
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+# Optional zstandard support: cross-filesystem backups are streamed into a
+# single compressed tarball instead of copied file-by-file when available.
+try:
+    import zstandard as _zstd
+except ImportError:
+    _zstd = None
+
+# Optional watchdog support: event-driven config-file monitoring via the
+# platform's native notification API (ReadDirectoryChangesW / inotify /
+# kqueue). Without it, monitor_config_file falls back to 1-second polling.
+try:
+    from watchdog.observers import Observer as _WatchdogObserver
+    from watchdog.events import FileSystemEventHandler as _FileSystemEventHandler
+except ImportError:
+    _WatchdogObserver = None
+    _FileSystemEventHandler = object
+
+
+# Resolved once at import: several hot paths compare against or anchor on
+# the script location, and Path construction/resolution is not free
+_SCRIPT_PATH = Path(__file__).resolve()
+_SCRIPT_DIR = _SCRIPT_PATH.parent
+
+
+def _json_dumps(obj) -> str:
+    """Serialize to pretty-printed UTF-8 JSON, using orjson when available."""
+    if _orjson is not None:
+        return _orjson.dumps(obj, option=_orjson.OPT_INDENT_2 | _orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
 # Color codes for better terminal output
 class Colors:
     RED = '\033[91m'
@@ -29,10 +80,20 @@ class Colors:
     UNDERLINE = '\033[4m'
     END = '\033[0m'
 
+# ANSI prefixes memoized per (color, bold) so every line is assembled
+# once and emitted with a single write() instead of print()'s several
+_COLOR_PREFIXES: Dict[tuple, str] = {}
+
+def format_colored(text: str, color: str = Colors.WHITE, bold: bool = False) -> str:
+    """Return text wrapped in the ANSI codes for a color/bold combination"""
+    prefix = _COLOR_PREFIXES.get((color, bold))
+    if prefix is None:
+        prefix = _COLOR_PREFIXES[(color, bold)] = (Colors.BOLD if bold else "") + color
+    return prefix + text + Colors.END
+
 def print_colored(text: str, color: str = Colors.WHITE, bold: bool = False, end: str = "\n"):
     """Print colored text to terminal"""
-    prefix = Colors.BOLD if bold else ""
-    print(f"{prefix}{color}{text}{Colors.END}", end=end)
+    sys.stdout.write(format_colored(text, color, bold) + end)
 
 def print_header(text: str):
     """Print a formatted header"""
@@ -57,72 +118,275 @@ def print_info(text: str):
     print_colored(f"ℹ {text}", Colors.BLUE)
 
 def show_progress(current: int, total: int, prefix: str = "Progress"):
-    """Show a simple progress indicator"""
+    """Show a simple progress indicator (throttled to ~60 updates/sec)"""
+    # Skip intermediate updates arriving faster than a terminal can render
+    # them; per-file prints would otherwise serialize the parallel copy loop.
+    now = time.monotonic()
+    if current != total and now - getattr(show_progress, '_last_update', 0.0) < 1.0 / 60.0:
+        return
+    show_progress._last_update = now
     percent = (current / total) * 100
     bar_length = 30
     filled_length = int(bar_length * current // total)
     bar = '█' * filled_length + '-' * (bar_length - filled_length)
     print(f"\r{prefix}: |{bar}| {percent:.1f}% ({current}/{total})", end='', flush=True)
 
+# Age buckets for backup listings, largest first: one total_seconds() call
+# and a short table scan instead of chained timedelta attribute reads
+_AGE_BUCKETS = ((86400, "days"), (3600, "hours"), (60, "minutes"))
+
+def _format_age(age: datetime.timedelta) -> str:
+    """Render a timedelta as a coarse '<n> <unit> ago' string"""
+    secs = age.total_seconds()
+    for threshold, unit in _AGE_BUCKETS:
+        if secs >= threshold:
+            return f"{int(secs // threshold)} {unit} ago"
+    return "Just now"
+
+_SIZE_NAMES = ("B", "KB", "MB", "GB", "TB")
+
 def format_file_size(size_bytes: int) -> str:
     """Format file size in human readable format"""
-    if size_bytes == 0:
+    if size_bytes <= 0:
         return "0B"
-    size_names = ["B", "KB", "MB", "GB", "TB"]
-    i = 0
-    size = float(size_bytes)
-    while size >= 1024.0 and i < len(size_names) - 1:
-        size /= 1024.0
-        i += 1
-    return f"{size:.1f}{size_names[i]}"
+    # bit_length() // 10 indexes the unit directly, replacing the divide loop
+    idx = min((size_bytes.bit_length() - 1) // 10, len(_SIZE_NAMES) - 1)
+    return f"{size_bytes / (1 << (idx * 10)):.1f}{_SIZE_NAMES[idx]}"
+
+def _scan_tree(path):
+    """Yield os.DirEntry objects for every file under a directory.
+
+    Uses os.scandir recursion so each entry's stat information comes from
+    the directory read itself (one syscall per directory instead of several
+    per file). Unreadable directories are skipped.
+    """
+    stack = [str(path)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    else:
+                        yield entry
+        except OSError:
+            continue
+
+
+# Names excluded from backups (same patterns previously passed to
+# shutil.ignore_patterns)
+_COPY_IGNORE_PATTERNS = ("backups", "*.pyc", "__pycache__", "*.tmp")
+
+
+def _build_copy_worklist(src_dir):
+    """Walk src_dir once with os.scandir and return (dirs, files) for copying.
+
+    dirs is the list of relative directory paths to create in the destination;
+    files is a flat list of (abs_src, rel_path) pairs with the standard ignore
+    patterns applied. The single traversal doubles as the file count for
+    progress reporting, so no separate counting pass is needed.
+    """
+    dirs = []
+    files = []
+    stack = [(str(src_dir), "")]
+    while stack:
+        src, rel = stack.pop()
+        try:
+            with os.scandir(src) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        for entry in entries:
+            if any(fnmatch.fnmatch(entry.name, pat) for pat in _COPY_IGNORE_PATTERNS):
+                continue
+            rel_sub = os.path.join(rel, entry.name) if rel else entry.name
+            if entry.is_dir(follow_symlinks=False):
+                dirs.append(rel_sub)
+                stack.append((entry.path, rel_sub))
+            else:
+                files.append((entry.path, rel_sub))
+    return dirs, files
+
+
+def _fast_copy_large(src, dst):
+    """Copy a large file with a 1 MiB buffer, preserving metadata.
+
+    shutil.copy2 moves data through a 64 KiB copyfileobj buffer, which is
+    measurably slower for multi-megabyte save files. On Linux,
+    os.copy_file_range is tried first (server-side copy on NFS, reflink on
+    btrfs/XFS); otherwise the data goes through a reusable 1 MiB bytearray
+    with readinto so no intermediate bytes objects are allocated.
+    """
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        copied = False
+        if hasattr(os, 'copy_file_range'):
+            try:
+                size = os.fstat(fsrc.fileno()).st_size
+                offset = 0
+                while offset < size:
+                    n = os.copy_file_range(fsrc.fileno(), fdst.fileno(), size - offset)
+                    if n == 0:
+                        break
+                    offset += n
+                copied = offset >= size
+            except OSError:
+                pass
+        if not copied:
+            fsrc.seek(0)
+            fdst.seek(0)
+            fdst.truncate()
+            buf = bytearray(1 << 20)
+            mv = memoryview(buf)
+            while True:
+                n = fsrc.readinto(buf)
+                if not n:
+                    break
+                fdst.write(mv[:n])
+    shutil.copystat(src, dst)
+
+
+def _copy2_or_large(src, dst, *, follow_symlinks=True):
+    """shutil.copy2 drop-in that routes files over 1 MiB through _fast_copy_large."""
+    try:
+        if os.path.getsize(src) > (1 << 20):
+            _fast_copy_large(src, dst)
+            return dst
+    except OSError:
+        pass
+    return shutil.copy2(src, dst, follow_symlinks=follow_symlinks)
+
 
 def get_directory_size(path: Path) -> int:
     """Calculate total size of directory"""
     total_size = 0
-    try:
-        for dirpath, dirnames, filenames in os.walk(path):
-            for filename in filenames:
-                file_path = os.path.join(dirpath, filename)
-                if os.path.exists(file_path):
-                    total_size += os.path.getsize(file_path)
-    except (OSError, FileNotFoundError):
-        pass
+    for entry in _scan_tree(path):
+        try:
+            # follow_symlinks=False lets DirEntry serve the size from the
+            # data returned by the directory read itself on Windows
+            # (FindFirstFile already includes it), making this loop one
+            # syscall per directory there and one lstat per file elsewhere
+            total_size += entry.stat(follow_symlinks=False).st_size
+        except OSError:
+            pass
     return total_size
 
 
-def compute_directory_sha256(path: Path) -> str:
-    """Compute a SHA256 hash for all files under a directory in a deterministic order."""
-    h = hashlib.sha256()
+def _new_hasher():
+    """Return a new incremental hasher: BLAKE3 if installed, else SHA-256."""
+    if _blake3 is not None:
+        return _blake3(max_threads=_blake3.AUTO)
+    return hashlib.sha256()
+
+
+def _hash_one_file(file_path: str) -> bytes:
+    """Hash a single file's content and return the raw digest bytes.
+
+    Prefers BLAKE3's memory-mapped path (SIMD over the whole file, no
+    per-chunk Python round-trips) and falls back to a buffered read loop.
+    """
+    if _blake3 is not None:
+        try:
+            h = _blake3(max_threads=_blake3.AUTO)
+            h.update_mmap(file_path)
+            return h.digest()
+        except (OSError, ValueError):
+            # mmap can fail on empty/special files; fall through to buffered read
+            pass
+    # hashlib.file_digest runs the whole read+update loop in C, releasing
+    # the GIL so pool workers hash truly in parallel
+    with open(file_path, 'rb') as f:
+        return hashlib.file_digest(f, _new_hasher).digest()
+
+
+def _combine_digest_entries(entries) -> str:
+    """Fold per-file (rel_path, size, digest) tuples into a directory digest.
+
+    Entries are sorted by relative path so the result is deterministic and
+    path-independent regardless of traversal order.
+    """
+    h = _new_hasher()
+    for rel_path, size, digest in sorted(entries):
+        h.update(rel_path.encode('utf-8'))
+        h.update(str(size).encode('utf-8'))
+        h.update(digest)
+    return h.hexdigest()
+
+
+def _hash_entry(args) -> tuple:
+    """Worker for compute_directory_checksum: hash one (rel_path, abs_path) pair."""
+    rel_path, file_path = args
+    try:
+        size = os.stat(file_path).st_size
+        digest = _hash_one_file(file_path)
+    except Exception:
+        # If a file can't be read, include an error marker
+        size = -1
+        digest = b'__unreadable__'
+    return (rel_path, size, digest)
+
+
+def compute_directory_checksum(path: Path) -> str:
+    """Compute a checksum for all files under a directory in a deterministic order.
+
+    Files are hashed in parallel by a thread pool (hash updates release the
+    GIL and reads overlap I/O stalls); the per-file digests are then combined
+    in sorted order so the result stays deterministic.
+    """
+    paths = []
     for root, dirs, files in os.walk(path):
         # Sort to ensure deterministic order
         dirs.sort()
         files.sort()
         for fname in files:
             file_path = os.path.join(root, fname)
-            try:
-                # Update with relative file path to make hash path-independent
-                rel_path = os.path.relpath(file_path, start=str(path)).replace('\\', '/')
-                h.update(rel_path.encode('utf-8'))
-                # Update with file size and content
-                stat = os.stat(file_path)
-                h.update(str(stat.st_size).encode('utf-8'))
-                with open(file_path, 'rb') as f:
-                    while True:
-                        chunk = f.read(8192)
-                        if not chunk:
-                            break
-                        h.update(chunk)
-            except Exception:
-                # If a file can't be read, include an error marker
-                h.update(b'__unreadable__')
-    return h.hexdigest()
+            # Use relative file paths to make the hash path-independent
+            rel_path = os.path.relpath(file_path, start=str(path)).replace('\\', '/')
+            paths.append((rel_path, file_path))
+
+    if not paths:
+        return _combine_digest_entries([])
+
+    # I/O-bound workload, so oversubscribe relative to core count
+    max_workers = min(32, (os.cpu_count() or 1) * 2)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        entries = list(executor.map(_hash_entry, paths, chunksize=16))
+    return _combine_digest_entries(entries)
+
+def _read_description(desc_file) -> Optional[str]:
+    """Read a .backup_description file, bounded to its first 256 bytes.
+
+    The display column is truncated anyway, and the bound keeps an
+    accidentally huge file (stray paste, wrong file) from being slurped
+    into memory once per listing row. Returns None if unreadable.
+    """
+    try:
+        with open(desc_file, 'rb') as f:
+            data = f.read(256)
+    except OSError:
+        return None
+    return data.decode('utf-8', errors='replace').strip()
+
+# Parsed config per path, keyed on (mtime_ns, size); avoids re-parsing
+# JSON when the file on disk hasn't changed between loads
+_config_load_cache: Dict[str, tuple] = {}
 
 def load_games_config(config_path: Path) -> Dict[str, Any]:
     """Load games configuration from JSON file"""
     try:
-        if config_path.exists():
+        try:
+            st = os.stat(config_path)
+        except OSError:
+            st = None
+        if st is not None:
+            key = str(config_path)
+            cached = _config_load_cache.get(key)
+            if cached and cached[0] == (st.st_mtime_ns, st.st_size):
+                # Deep copy so caller mutations don't poison the cache
+                return copy.deepcopy(cached[1])
             with open(config_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+                config = json.load(f)
+            _config_load_cache[key] = ((st.st_mtime_ns, st.st_size), copy.deepcopy(config))
+            return config
         else:
             # Create default config
             default_config = {
@@ -146,16 +410,37 @@ def load_games_config(config_path: Path) -> Dict[str, Any]:
         print_error(f"Failed to load config file: {e}")
         return {"games": {}, "settings": {"default_max_backups": 10}}
 
+# Last serialized content per config path, used to skip redundant writes
+_config_write_cache: Dict[str, str] = {}
+
 def save_games_config(config_path: Path, config: Dict[str, Any]):
     """Save games configuration to JSON file"""
     try:
-        with open(config_path, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=2, ensure_ascii=False)
+        serialized = _json_dumps(config)
+        # Frequent saves (e.g. remembering the selected game) often carry
+        # identical content; don't touch the disk for those
+        if _config_write_cache.get(str(config_path)) == serialized:
+            return
+        # Write to a sibling temp file and rename so a crash mid-write
+        # never leaves a truncated config behind
+        tmp_path = config_path.with_name(config_path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(serialized)
+        os.replace(tmp_path, config_path)
+        _config_write_cache[str(config_path)] = serialized
+        # Keep the parse cache in step so the next load is a no-op
+        try:
+            st = os.stat(config_path)
+            _config_load_cache[str(config_path)] = (
+                (st.st_mtime_ns, st.st_size), copy.deepcopy(config))
+        except OSError:
+            pass
     except Exception as e:
         print_error(f"Failed to save config file: {e}")
 
+@functools.lru_cache(maxsize=256)
 def expand_path(path_str: str) -> str:
-    """Expand environment variables and user paths"""
+    """Expand environment variables and user paths (memoized per session)"""
     # Expand environment variables
     expanded = os.path.expandvars(path_str)
     # Expand user home directory
@@ -357,7 +642,7 @@ class SaveBackupManager:
         if backup_dir:
             self.backup_dir = Path(backup_dir)
         else:
-            self.backup_dir = Path(__file__).parent / "backups"
+            self.backup_dir = _SCRIPT_DIR / "backups"
         self.max_backups = max_backups
         self.game_name = game_name
         # New options for handling locked files and hooks
@@ -366,6 +651,19 @@ class SaveBackupManager:
         self.post_backup_cmd = post_backup_cmd
         self.retries = retries
         self.retry_delay = retry_delay
+        # Recovered temp dirs are not re-hashed by default: the hash is only
+        # stored (never verified against a prior value), and re-reading a large
+        # save on startup is expensive. Set True to hash recovered backups.
+        self.recovery_hash = False
+        # Memoized directory sizes: {path: (root_mtime_ns, size_bytes)}.
+        # Only the top-level save dir is cached, to bound memory.
+        self._size_cache: Dict[str, tuple] = {}
+        # Memoized backup listing, keyed on the backup dir's mtime_ns; any
+        # backup added or removed bumps the directory mtime and invalidates it
+        self._backup_list_cache: Optional[List[str]] = None
+        self._backup_list_mtime: Optional[int] = None
+        # Per-backup mtime_ns captured during the listing scan
+        self._backup_mtimes: Dict[str, int] = {}
         
         # Create backup directory if it doesn't exist (create any missing parent dirs)
         self.backup_dir.mkdir(parents=True, exist_ok=True)
@@ -388,7 +686,13 @@ class SaveBackupManager:
             """Error handler for Windows read-only files"""
             exc = exc_info[1] if isinstance(exc_info, tuple) else exc_info
             if hasattr(exc, 'errno') and exc.errno == 13:  # Permission denied
-                os.chmod(path, 0o777)
+                if os.name == 'nt':
+                    # One Win32 call clears read-only/hidden/system at once
+                    # (FILE_ATTRIBUTE_NORMAL), where chmod only touches the
+                    # read-only bit through the CRT
+                    ctypes.windll.kernel32.SetFileAttributesW(str(path), 0x80)
+                else:
+                    os.chmod(path, 0o777)
                 func(path)
             else:
                 raise exc
@@ -437,9 +741,14 @@ class SaveBackupManager:
             return False
 
         try:
-            with open(dst_path, 'wb') as out_f:
-                buf_size = 8192
+            # Unbuffered output: each ReadFile already delivers a large block,
+            # so Python's buffered IO layer would only add an extra copy.
+            with open(dst_path, 'wb', buffering=0) as out_f:
+                buf_size = 1 << 20
                 buf = ctypes.create_string_buffer(buf_size)
+                # memoryview slices are zero-copy, unlike buf.raw[:n] which
+                # allocates a new bytes object per chunk
+                mv = memoryview(buf)
                 bytes_read = wintypes.DWORD(0)
                 while True:
                     ok = ReadFile(handle, buf, buf_size, ctypes.byref(bytes_read), None)
@@ -447,7 +756,7 @@ class SaveBackupManager:
                         break
                     if bytes_read.value == 0:
                         break
-                    out_f.write(buf.raw[:bytes_read.value])
+                    out_f.write(mv[:bytes_read.value])
         finally:
             CloseHandle(handle)
         try:
@@ -456,11 +765,152 @@ class SaveBackupManager:
             pass
         return True
 
+    def _win_copyfile(self, src: str, dst: str) -> bool:
+        """Copy a file via Win32 CopyFileExW so the kernel moves the bytes.
+
+        shutil.copy2 on Windows loops through a 64 KiB Python buffer;
+        CopyFileExW copies with large kernel-internal buffers and preserves
+        timestamps/attributes itself. Returns True on success.
+        """
+        if os.name != 'nt':
+            return False
+
+        CopyFileExW = ctypes.windll.kernel32.CopyFileExW
+        cancel = ctypes.c_int(0)
+        ok = CopyFileExW(wintypes.LPCWSTR(src), wintypes.LPCWSTR(dst),
+                         None, None, ctypes.byref(cancel), 0)
+        if not ok:
+            return False
+        try:
+            shutil.copystat(src, dst)
+        except Exception:
+            pass
+        return True
+
+    def _linux_copyfile(self, src: str, dst: str) -> bool:
+        """Copy file bytes in-kernel with copy_file_range on Linux.
+
+        Avoids per-chunk user-space round-trips entirely and lets
+        reflink-capable filesystems (btrfs/XFS) clone extents instead of
+        duplicating data. Returns True on success.
+        """
+        if not hasattr(os, 'copy_file_range'):
+            return False
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                in_fd, out_fd = fsrc.fileno(), fdst.fileno()
+                remaining = os.fstat(in_fd).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(in_fd, out_fd, remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            shutil.copystat(src, dst)
+            return True
+        except OSError:
+            return False
+
+    def _load_hash_cache(self):
+        """Open the on-disk digest index and load it into memory.
+
+        The index lives in <backup_dir>/hashes.db and maps
+        (source path, size, mtime_ns) -> digest hex, so files that haven't
+        changed since any earlier backup never need re-hashing. Returns
+        (connection, cache_dict); both degrade gracefully to (None, {}).
+        """
+        try:
+            conn = sqlite3.connect(str(self.backup_dir / 'hashes.db'))
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS hashes ("
+                "path TEXT, size INTEGER, mtime INTEGER, digest TEXT, "
+                "PRIMARY KEY (path, size, mtime))")
+            rows = conn.execute("SELECT path, size, mtime, digest FROM hashes").fetchall()
+            return conn, {(p, s, m): d for p, s, m, d in rows}
+        except Exception:
+            return None, {}
+
+    def _store_hash_cache(self, conn, new_rows):
+        """Batch-write freshly computed digests and close the index."""
+        if conn is None:
+            return
+        try:
+            if new_rows:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO hashes (path, size, mtime, digest) "
+                    "VALUES (?, ?, ?, ?)", new_rows)
+                conn.commit()
+        except Exception:
+            pass
+        finally:
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+    def _copy_and_hash(self, src: str, dst: str) -> Optional[bytes]:
+        """Copy src to dst while hashing the stream in a single pass.
+
+        Reads each 1 MiB block once and feeds it to both the destination
+        write and the hasher, so backup+checksum costs one read of the
+        source instead of a copy plus a re-read. Retries and locked-file
+        handling mirror _safe_copy. Returns the content digest, or None if
+        the file was skipped (locked and skip_locked_files is set).
+        """
+        last_err = None
+        for attempt in range(1, max(1, self.retries) + 1):
+            try:
+                h = _new_hasher()
+                buf = bytearray(1 << 20)
+                mv = memoryview(buf)
+                with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                    while True:
+                        n = fsrc.readinto(buf)
+                        if not n:
+                            break
+                        fdst.write(mv[:n])
+                        h.update(mv[:n])
+                try:
+                    shutil.copystat(src, dst)
+                except OSError:
+                    pass
+                return h.digest()
+            except (PermissionError, OSError) as e:
+                last_err = e
+                # Try Windows-specific fallback to read locked files
+                if os.name == 'nt':
+                    try:
+                        if self._win_read_file_to_path(src, dst):
+                            return _hash_one_file(dst)
+                    except Exception:
+                        pass
+
+                if attempt < self.retries:
+                    time.sleep(self.retry_delay * attempt)
+                    continue
+                if self.skip_locked_files:
+                    print_warning(f"Skipping locked file: {src} -> {dst} ({last_err})")
+                    return None
+                raise
+
     def _safe_copy(self, src: str, dst: str, follow_symlinks=True) -> None:
         """Copy a single file with retries and Windows fallback for locked files."""
         last_err = None
         for attempt in range(1, max(1, self.retries) + 1):
             try:
+                # Prefer the kernel fast paths: CopyFileExW on Windows,
+                # copy_file_range (reflink-capable) on Linux. shutil.copy2
+                # remains the portable fallback.
+                if follow_symlinks:
+                    try:
+                        if os.name == 'nt':
+                            if self._win_copyfile(src, dst):
+                                return
+                        elif sys.platform.startswith('linux'):
+                            if self._linux_copyfile(src, dst):
+                                return
+                    except Exception:
+                        pass
                 shutil.copy2(src, dst, follow_symlinks=follow_symlinks)
                 return
             except (PermissionError, OSError) as e:
@@ -485,15 +935,23 @@ class SaveBackupManager:
                 raise
     
     def _get_save_size(self) -> str:
-        """Get the size of the save directory"""
+        """Get the size of the save directory, memoized on its root mtime"""
         try:
-            size = get_directory_size(self.save_dir)
+            key = str(self.save_dir)
+            mtime_ns = os.stat(self.save_dir).st_mtime_ns
+            cached = self._size_cache.get(key)
+            if cached is not None and cached[0] == mtime_ns:
+                size = cached[1]
+            else:
+                size = get_directory_size(self.save_dir)
+                self._size_cache[key] = (mtime_ns, size)
             return format_file_size(size)
         except Exception:
             return "Unknown"
     
-    def _cleanup_old_backups(self):
-        """Remove old backups if we exceed max_backups"""
+    def _cleanup_old_backups(self) -> int:
+        """Remove old backups if we exceed max_backups; return count removed"""
+        removed = 0
         backups = self._get_backup_list()
         if len(backups) > self.max_backups:
             backups_to_delete = backups[self.max_backups:]
@@ -501,15 +959,43 @@ class SaveBackupManager:
             for backup_path in backups_to_delete:
                 try:
                     self._safe_rmtree(backup_path)
-                    backup_name = Path(backup_path).name
+                    backup_name = backup_path.name
                     print_info(f"Deleted old backup: {backup_name}")
+                    removed += 1
                 except Exception as e:
                     print_error(f"Failed to delete {backup_path}: {e}")
+            self._backup_list_cache = None
+        return removed
     
-    def _get_backup_list(self) -> List[str]:
+    def _get_backup_list(self) -> List[Path]:
         """Get sorted list of backup directories"""
-        backup_pattern = self.backup_dir / "backup_*"
-        return sorted(glob.glob(str(backup_pattern)), reverse=True)
+        try:
+            dir_mtime = os.stat(self.backup_dir).st_mtime_ns
+        except OSError:
+            return []
+        if dir_mtime == self._backup_list_mtime and self._backup_list_cache is not None:
+            return self._backup_list_cache
+        backups = []
+        mtimes = {}
+        try:
+            with os.scandir(self.backup_dir) as it:
+                for entry in it:
+                    if entry.name.startswith('backup_') and entry.is_dir(follow_symlinks=False):
+                        backups.append(Path(entry.path))
+                        # DirEntry carries the stat from the directory scan
+                        # (free on Windows), so record each backup's mtime
+                        # here and spare callers a stat per backup
+                        try:
+                            mtimes[entry.path] = entry.stat(follow_symlinks=False).st_mtime_ns
+                        except OSError:
+                            pass
+        except OSError:
+            return []
+        backups.sort(reverse=True)
+        self._backup_mtimes = mtimes
+        self._backup_list_cache = backups
+        self._backup_list_mtime = dir_mtime
+        return backups
 
     def _recover_or_cleanup_tmp_dirs(self):
         """Detect leftover temp backup dirs (created with mkdtemp prefix '.backup_...') and
@@ -530,7 +1016,7 @@ class SaveBackupManager:
                 print_info(f"Found leftover temp backup dir: {name}")
 
                 # Heuristic: if directory has no files, remove it; otherwise attempt recovery
-                file_count = sum(len(files) for _, _, files in os.walk(entry))
+                file_count = sum(1 for _ in _scan_tree(entry))
                 if file_count == 0:
                     print_info(f"Removing empty temp dir: {name}")
                     self._safe_rmtree(entry)
@@ -566,11 +1052,13 @@ class SaveBackupManager:
                         self._safe_rmtree(entry)
                         continue
 
-                # Write metadata for recovered backup
+                # Write metadata for recovered backup. Hashing the whole tree
+                # is skipped unless opted in; users wanting verification can
+                # run a separate verify pass.
                 try:
-                    checksum = compute_directory_sha256(final_path)
+                    checksum = compute_directory_checksum(final_path) if self.recovery_hash else None
                     total_size = get_directory_size(final_path)
-                    total_files = sum(len(files) for _, _, files in os.walk(final_path))
+                    total_files = sum(1 for _ in _scan_tree(final_path))
                     meta = {
                         "completed_at": datetime.datetime.now().isoformat(),
                         "checksum": checksum,
@@ -580,7 +1068,7 @@ class SaveBackupManager:
                         "recovered": True
                     }
                     meta_file = final_path / ".backup_meta.json"
-                    meta_file.write_text(json.dumps(meta, indent=2, ensure_ascii=False), encoding='utf-8')
+                    meta_file.write_text(_json_dumps(meta), encoding='utf-8')
                     print_success(f"Recovered backup: {final_base}")
                 except Exception as meta_err:
                     print_warning(f"Failed to write metadata for recovered backup {final_base}: {meta_err}")
@@ -603,45 +1091,138 @@ class SaveBackupManager:
             if description:
                 print_info(f"Description: {description}")
             
-            # Count files for progress
-            file_count = sum(len(files) for _, _, files in os.walk(self.save_dir))
+            # One scandir traversal yields both the copy worklist and the
+            # file count for progress reporting
+            dir_list, work_items = _build_copy_worklist(self.save_dir)
+            file_count = len(work_items)
             if file_count == 0:
                 print_warning("No files found in save directory")
                 return None
             
+            # Cross-filesystem backups can't hardlink against the previous
+            # backup and pay full per-file open/close cost on the
+            # destination; stream everything into one compressed tarball
+            # instead when zstandard is available
+            if _zstd is not None:
+                try:
+                    cross_fs = (os.stat(self.save_dir).st_dev
+                                != os.stat(self.backup_dir).st_dev)
+                except OSError:
+                    cross_fs = False
+                if cross_fs:
+                    result = self._create_archive_backup(
+                        backup_name, backup_path, description, work_items)
+                    if result is not None:
+                        self._cleanup_old_backups()
+                    return result
+
             print_info(f"Backing up {file_count} files...")
-            
+
             # Show progress during backup
             start_time = time.time()
-            
-            def copy_with_progress(src, dst, *, follow_symlinks=True):
-                files_copied = getattr(copy_with_progress, 'counter', 0)
-                copy_with_progress.counter = files_copied + 1
-                show_progress(copy_with_progress.counter, file_count, "Copying files")
-                # Use safe copy that handles locked files and retries
+
+            # Per-file (rel_path, size, digest) tuples collected while copying
+            # so the checksum doesn't need a second full pass over the backup
+            file_digests = []
+            # Per-file index written to metadata: {rel: [size, mtime_ns, digest_hex]}
+            files_index = {}
+
+            # Load the previous backup's file index so unchanged files can be
+            # hardlinked instead of copied (incremental backups)
+            prev_backup_path = None
+            prev_entries = {}
+            prior_backups = self._get_backup_list()
+            if prior_backups:
+                prev_backup_path = prior_backups[0]
                 try:
-                    self._safe_copy(src, dst, follow_symlinks=follow_symlinks)
-                    return dst
+                    prev_meta = json.loads(
+                        (prev_backup_path / ".backup_meta.json").read_text(encoding='utf-8'))
+                    prev_entries = prev_meta.get("file_entries", {}) or {}
                 except Exception:
-                    # Re-raise to allow higher-level handler to catch and cleanup
-                    raise
+                    prev_entries = {}
+
+            # On-disk digest index: files whose (path, size, mtime) match an
+            # entry from any earlier backup are copied without re-hashing
+            hash_db, hash_cache = self._load_hash_cache()
+            new_hash_rows = []
+
+            # itertools.count increments atomically at the C level, so the
+            # parallel copy workers don't race on a Python read-modify-write
+            progress_counter = itertools.count(1)
+
+            def copy_with_progress(src, dst, *, follow_symlinks=True):
+                show_progress(next(progress_counter), file_count, "Copying files")
+                # Unchanged since the previous backup? Hardlink from it and
+                # reuse the recorded digest instead of copying + rehashing.
+                if prev_entries:
+                    try:
+                        rel_path = os.path.relpath(dst, start=str(tmp_dir)).replace('\\', '/')
+                        src_stat = os.stat(src)
+                        prior = prev_entries.get(rel_path)
+                        if (prior and prior[0] == src_stat.st_size
+                                and prior[1] == src_stat.st_mtime_ns):
+                            os.link(str(prev_backup_path / rel_path), dst)
+                            file_digests.append((rel_path, prior[0], bytes.fromhex(prior[2])))
+                            files_index[rel_path] = prior
+                            return dst
+                    except (OSError, ValueError):
+                        # Cross-filesystem link, missing source, bad digest
+                        # entry, etc.: fall back to a regular copy
+                        pass
+                # Known digest from the on-disk index? Plain-copy and skip the
+                # hashing half of the tee.
+                if hash_cache:
+                    try:
+                        src_stat = os.stat(src)
+                        cached = hash_cache.get((src, src_stat.st_size, src_stat.st_mtime_ns))
+                        if cached:
+                            self._safe_copy(src, dst, follow_symlinks=follow_symlinks)
+                            rel_path = os.path.relpath(dst, start=str(tmp_dir)).replace('\\', '/')
+                            st = os.stat(dst)
+                            file_digests.append((rel_path, st.st_size, bytes.fromhex(cached)))
+                            files_index[rel_path] = [st.st_size, st.st_mtime_ns, cached]
+                            return dst
+                    except (OSError, ValueError):
+                        pass
+                # Copy and hash in one pass (handles locked files and retries);
+                # exceptions propagate so the higher-level handler can cleanup.
+                # Skipped/locked files simply don't contribute a digest and
+                # force a full recompute below.
+                digest = self._copy_and_hash(src, dst)
+                if digest is not None:
+                    try:
+                        rel_path = os.path.relpath(dst, start=str(tmp_dir)).replace('\\', '/')
+                        st = os.stat(dst)
+                        src_stat = os.stat(src)
+                        file_digests.append((rel_path, st.st_size, digest))
+                        files_index[rel_path] = [st.st_size, st.st_mtime_ns, digest.hex()]
+                        new_hash_rows.append((src, src_stat.st_size, src_stat.st_mtime_ns,
+                                              digest.hex()))
+                    except OSError:
+                        pass
+                return dst
             
             # Perform copy into a temporary directory inside the backups folder so
             # incomplete backups are never visible to listing/restore operations.
             tmp_dir = None
             try:
-                # Create a temp directory path (shutil.copytree requires dest to not exist)
+                # Create a temp directory for the in-progress copy.
                 # Use a hidden prefix so it's ignored by normal listings
                 tmp_dir = Path(tempfile.mkdtemp(prefix=f".{backup_name}.", dir=str(self.backup_dir)))
 
-                # Copy into the temp directory
-                shutil.copytree(
-                    self.save_dir,
-                    tmp_dir,
-                    ignore=shutil.ignore_patterns("backups", "*.pyc", "__pycache__", "*.tmp"),
-                    copy_function=copy_with_progress,
-                    dirs_exist_ok=True
-                )
+                # Recreate the directory skeleton, then let a thread pool copy
+                # the worklist in parallel (hashing and I/O overlap across
+                # workers)
+                tmp_root = str(tmp_dir)
+                for rel_sub in dir_list:
+                    os.makedirs(os.path.join(tmp_root, rel_sub), exist_ok=True)
+
+                max_workers = min(32, (os.cpu_count() or 1) * 2)
+                with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    for _ in executor.map(
+                            lambda item: copy_with_progress(item[0], os.path.join(tmp_root, item[1])),
+                            work_items, chunksize=32):
+                        pass
 
                 print()  # New line after progress bar
                 elapsed_time = time.time() - start_time
@@ -650,6 +1231,14 @@ class SaveBackupManager:
                 if description:
                     desc_file = tmp_dir / ".backup_description"
                     desc_file.write_text(description, encoding='utf-8')
+                    try:
+                        st = os.stat(desc_file)
+                        digest = _hash_one_file(str(desc_file))
+                        file_digests.append((".backup_description", st.st_size, digest))
+                        files_index[".backup_description"] = [st.st_size, st.st_mtime_ns,
+                                                             digest.hex()]
+                    except OSError:
+                        pass
 
                 # Atomically move the completed temp dir to the final name.
                 # os.replace is atomic on the same filesystem; if we get EXDEV
@@ -675,12 +1264,19 @@ class SaveBackupManager:
                     else:
                         raise
                 tmp_dir = None  # transferred ownership to final location
+                self._backup_list_cache = None  # a new backup now exists
 
-                # After successful atomic move, compute checksum and write metadata
+                # After successful atomic move, write metadata. The checksum is
+                # combined from the digests gathered during the copy; a full
+                # re-read only happens if some files weren't covered (e.g.
+                # skipped locked files).
                 try:
-                    checksum = compute_directory_sha256(backup_path)
                     total_size = get_directory_size(backup_path)
-                    total_files = sum(len(files) for _, _, files in os.walk(backup_path))
+                    total_files = sum(1 for _ in _scan_tree(backup_path))
+                    if file_digests and len(file_digests) == total_files:
+                        checksum = _combine_digest_entries(file_digests)
+                    else:
+                        checksum = compute_directory_checksum(backup_path)
                     meta = {
                         "completed_at": datetime.datetime.now().isoformat(),
                         "checksum": checksum,
@@ -688,10 +1284,12 @@ class SaveBackupManager:
                         "size_bytes": total_size,
                         "move_method": move_method
                     }
+                    if files_index:
+                        meta["file_entries"] = files_index
                     if description:
                         meta["description"] = description
                     meta_file = backup_path / ".backup_meta.json"
-                    meta_file.write_text(json.dumps(meta, indent=2, ensure_ascii=False), encoding='utf-8')
+                    meta_file.write_text(_json_dumps(meta), encoding='utf-8')
                 except Exception as meta_err:
                     # Don't fail the backup if metadata write fails; log and continue
                     print_warning(f"Failed to write backup metadata: {meta_err}")
@@ -700,6 +1298,9 @@ class SaveBackupManager:
                 print_info(f"Location: {backup_path}")
 
             finally:
+                # Persist any freshly computed digests in one batched write
+                # (valid even if the backup itself was aborted mid-way)
+                self._store_hash_cache(hash_db, new_hash_rows)
                 # Cleanup temp dir if something went wrong and it still exists
                 if tmp_dir and tmp_dir.exists():
                     try:
@@ -716,7 +1317,80 @@ class SaveBackupManager:
             print_error(f"Failed to create backup: {e}")
             return None
     
-    def list_backups(self) -> List[str]:
+    def _create_archive_backup(self, backup_name: str, backup_path: Path,
+                               description: Optional[str],
+                               work_items: List[tuple]) -> Optional[Path]:
+        """Create a backup as a single data.tar.zst archive.
+
+        Used when the backup directory sits on a different filesystem: one
+        sequential compressed write replaces N per-file open/write/close
+        round-trips on the destination drive, and zstd level 1 typically
+        shrinks save data substantially. Listing and metadata work as for
+        directory backups; the manifest marks the format so restore knows
+        to extract instead of copy.
+        """
+        print_info("Backup directory is on a different filesystem; "
+                   "streaming compressed archive...")
+        file_count = len(work_items)
+        print_info(f"Archiving {file_count} files...")
+        start_time = time.time()
+
+        total_size = 0
+        tmp_dir = None
+        try:
+            tmp_dir = Path(tempfile.mkdtemp(prefix=f".{backup_name}.",
+                                            dir=str(self.backup_dir)))
+            archive_path = tmp_dir / "data.tar.zst"
+            progress_counter = itertools.count(1)
+            compressor = _zstd.ZstdCompressor(level=1)
+            with open(archive_path, 'wb') as fp:
+                with compressor.stream_writer(fp, closefd=False) as writer:
+                    with tarfile.open(fileobj=writer, mode='w|') as tar:
+                        for src, rel in work_items:
+                            show_progress(next(progress_counter), file_count,
+                                          "Archiving files")
+                            try:
+                                total_size += os.stat(src).st_size
+                            except OSError:
+                                pass
+                            tar.add(src, arcname=rel, recursive=False)
+            print()  # New line after progress bar
+            elapsed_time = time.time() - start_time
+
+            if description:
+                (tmp_dir / ".backup_description").write_text(description,
+                                                             encoding='utf-8')
+
+            meta = {
+                "completed_at": datetime.datetime.now().isoformat(),
+                "checksum": _hash_one_file(str(archive_path)).hex(),
+                "files": file_count,
+                "size_bytes": total_size,
+                "move_method": "atomic",
+                "format": "tar-zst"
+            }
+            if description:
+                meta["description"] = description
+            (tmp_dir / ".backup_meta.json").write_text(_json_dumps(meta),
+                                                       encoding='utf-8')
+
+            # tmp dir and final location share a filesystem, so this rename
+            # is atomic (the archive itself already crossed devices above)
+            os.replace(str(tmp_dir), str(backup_path))
+            tmp_dir = None
+            self._backup_list_cache = None
+
+            print_success(f"Backup created successfully in {elapsed_time:.1f}s")
+            print_info(f"Location: {backup_path}")
+            return backup_path
+        finally:
+            if tmp_dir and tmp_dir.exists():
+                try:
+                    self._safe_rmtree(tmp_dir)
+                except Exception:
+                    pass
+
+    def list_backups(self) -> List[Path]:
         """List all available backups with enhanced formatting"""
         backups = self._get_backup_list()
         
@@ -725,50 +1399,91 @@ class SaveBackupManager:
             return []
         
         print_header("Available Backups")
-        
-        for i, backup in enumerate(backups, 1):
-            backup_path = Path(backup)
+
+        now = datetime.datetime.now()
+
+        def _format_one(numbered) -> str:
+            i, backup = numbered
+            backup_path = backup
             backup_name = backup_path.name
-            
+
             # Extract timestamp from backup name
             timestamp_str = backup_name.replace("backup_", "")
             try:
                 timestamp = datetime.datetime.strptime(timestamp_str, "%Y%m%d_%H%M%S")
-                formatted_time = timestamp.strftime("%Y-%m-%d %H:%M:%S")
-                
-                # Calculate age
-                age = datetime.datetime.now() - timestamp
-                if age.days > 0:
-                    age_str = f"{age.days} days ago"
-                elif age.seconds > 3600:
-                    age_str = f"{age.seconds // 3600} hours ago"
-                elif age.seconds > 60:
-                    age_str = f"{age.seconds // 60} minutes ago"
-                else:
-                    age_str = "Just now"
-                
-                # Get backup size
-                backup_size = format_file_size(get_directory_size(backup_path))
-                
-                # Check for description
-                desc_file = backup_path / ".backup_description"
-                description = ""
-                if desc_file.exists():
-                    try:
-                        description = f" - {desc_file.read_text(encoding='utf-8').strip()}"
-                    except Exception:
-                        pass
-                
-                print_colored(f"{i:2d}. ", Colors.CYAN, bold=True, end="")
-                print_colored(f"{backup_name}", Colors.WHITE, bold=True)
-                print_colored(f"    📅 {formatted_time} ({age_str})", Colors.BLUE, end="")
-                print_colored(f" - {backup_size}{description}", Colors.MAGENTA)
-                
             except ValueError:
-                print_colored(f"{i:2d}. {backup_name}", Colors.WHITE)
-        
+                return format_colored(f"{i:2d}. {backup_name}", Colors.WHITE) + "\n"
+            formatted_time = timestamp.strftime("%Y-%m-%d %H:%M:%S")
+
+            age_str = _format_age(now - timestamp)
+
+            # Backups are immutable once created, so the size recorded in
+            # the metadata manifest is authoritative; only fall back to
+            # walking the tree for pre-manifest backups
+            try:
+                meta = json.loads(
+                    (backup_path / ".backup_meta.json").read_text(encoding='utf-8'))
+            except (OSError, ValueError):
+                meta = {}
+
+            size_bytes = meta.get("size_bytes")
+            description = f" - {meta['description']}" if meta.get("description") else None
+
+            if size_bytes is None:
+                # Pre-manifest backup: one scandir traversal picks up
+                # both the total size and the description sidecar,
+                # instead of a size walk plus a separate exists()+read
+                size_bytes = 0
+                for entry in _scan_tree(backup_path):
+                    try:
+                        size_bytes += entry.stat().st_size
+                    except OSError:
+                        continue
+                    if description is None and entry.name == ".backup_description":
+                        desc = _read_description(entry.path)
+                        if desc is not None:
+                            description = f" - {desc}"
+            backup_size = format_file_size(size_bytes)
+
+            # Description fallback for manifests without one
+            if description is None:
+                desc = _read_description(backup_path / ".backup_description")
+                description = f" - {desc}" if desc is not None else ""
+
+            return (format_colored(f"{i:2d}. ", Colors.CYAN, bold=True)
+                    + format_colored(backup_name, Colors.WHITE, bold=True) + "\n"
+                    + format_colored(f"    📅 {formatted_time} ({age_str})", Colors.BLUE)
+                    + format_colored(f" - {backup_size}{description}", Colors.MAGENTA) + "\n")
+
+        # The per-backup work is manifest/description reads (I/O that
+        # releases the GIL), so format entries concurrently; map preserves
+        # order and the joined result goes out in a single write
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+            lines = executor.map(_format_one, enumerate(backups, 1))
+            sys.stdout.write("".join(lines))
+
         return backups
     
+    def _fast_copytree(self, src: str, dst: str) -> bool:
+        """Copy a whole tree with the platform's native copier.
+
+        robocopy on Windows runs 16 copy threads in one process; cp -a on
+        POSIX avoids Python's per-file overhead. Returns True on success so
+        callers can fall back to the Python copy loop. robocopy exit codes
+        up to 7 are informational bitflags, not errors.
+        """
+        try:
+            if os.name == 'nt':
+                result = subprocess.run(
+                    ['robocopy', src, dst, '/E', '/MT:16', '/COPY:DAT',
+                     '/R:2', '/W:1', '/NFL', '/NDL', '/NP'],
+                    capture_output=True)
+                return result.returncode <= 7
+            result = subprocess.run(['cp', '-a', f'{src}/.', dst], capture_output=True)
+            return result.returncode == 0
+        except OSError:
+            return False
+
     def restore_backup(self, backup_choice: Optional[int] = None, skip_confirmation: bool = False) -> bool:
         """Restore a backup to the save directory"""
         backups = self._get_backup_list()
@@ -799,20 +1514,16 @@ class SaveBackupManager:
                 return False
             backup_path = backups[backup_choice - 1]
         
-        backup_name = Path(backup_path).name
+        backup_name = backup_path.name
         
         # Show backup info
         print_header("Restore Backup")
         print_info(f"Selected backup: {backup_name}")
         
-        # Check for description
-        desc_file = Path(backup_path) / ".backup_description"
-        if desc_file.exists():
-            try:
-                description = desc_file.read_text(encoding='utf-8').strip()
-                print_info(f"Description: {description}")
-            except Exception:
-                pass
+        # Check for description (EAFP: one open instead of stat + open)
+        description = _read_description(backup_path / ".backup_description")
+        if description is not None:
+            print_info(f"Description: {description}")
         
         # Confirm restoration (skip if requested)
         if not skip_confirmation:
@@ -826,59 +1537,150 @@ class SaveBackupManager:
             # Create a backup of current state before restoring
             #print_info("Creating safety backup of current state...")
             #current_backup = self.create_backup("Pre-restore safety backup")
-            
-            # Remove current save files (except backup folder)
-            print_info("Removing current save files...")
-            for item in self.save_dir.iterdir():
-                if item.name != "backups" and item != Path(__file__):
-                    try:
-                        if item.is_dir():
-                            self._safe_rmtree(item)
-                        else:
-                            # Handle read-only files
-                            if not os.access(item, os.W_OK):
-                                os.chmod(item, 0o777)
-                            item.unlink()
-                    except PermissionError as e:
-                        print_warning(f"Could not remove {item.name}: {e}")
-                        print_info("Trying alternative removal method...")
-                        try:
-                            # Try using system command as fallback
-                            if item.is_dir():
-                                subprocess.run(['rmdir', '/s', '/q', str(item)], shell=True, check=False)
-                            else:
-                                subprocess.run(['del', '/f', '/q', str(item)], shell=True, check=False)
-                        except Exception as fallback_error:
-                            print_error(f"Failed to remove {item.name}: {fallback_error}")
-                            return False
-            
-            # Copy backup contents to save directory
+
+            # Stage the restore into a sibling directory, then swap it in
+            # with renames. A crash mid-restore leaves either the old tree
+            # or the new one fully intact — never a half-deleted mix — and
+            # the old tree is deleted off the user-visible critical path.
+            staging = self.save_dir.parent / (self.save_dir.name + ".restoring")
+            old_dir = self.save_dir.parent / (self.save_dir.name + ".old")
+            for leftover in (staging, old_dir):
+                if leftover.exists():
+                    self._safe_rmtree(str(leftover))
+            staging.mkdir()
+
+            # Entries that belong to the manager, not the save data; they
+            # are carried over into the restored tree instead of deleted
+            script_path = str(_SCRIPT_PATH)
+            preserved = []
+            with os.scandir(self.save_dir) as it:
+                for entry in it:
+                    if entry.name == "backups" or os.path.abspath(entry.path) == script_path:
+                        preserved.append(entry.name)
+
+            # Copy backup contents into the staging directory
             print_info("Restoring backup files...")
-            backup_path_obj = Path(backup_path)
-            files_to_restore = sum(len(files) for _, _, files in os.walk(backup_path_obj))
-            
-            files_restored = 0
-            for item in backup_path_obj.iterdir():
-                if item.name == ".backup_description":
-                    continue
-                    
-                dest = self.save_dir / item.name
-                if item.is_dir():
-                    shutil.copytree(item, dest)
-                    # Count files in directory
-                    files_restored += sum(len(files) for _, _, files in os.walk(item))
-                else:
-                    shutil.copy2(item, dest)
-                    files_restored += 1
-                
-                show_progress(files_restored, files_to_restore, "Restoring")
-            
-            print()  # New line after progress bar
+            backup_path_obj = backup_path
+
+            archive = backup_path_obj / "data.tar.zst"
+            # Archive-format backup (written for cross-filesystem targets):
+            # one sequential decompress-and-extract pass into staging
+            if archive.exists():
+                if _zstd is None:
+                    print_error("Backup is a compressed archive but the "
+                                "'zstandard' package is not installed.")
+                    self._safe_rmtree(str(staging))
+                    return False
+                with open(archive, 'rb') as fp:
+                    with _zstd.ZstdDecompressor().stream_reader(fp) as reader:
+                        with tarfile.open(fileobj=reader, mode='r|') as tar:
+                            tar.extractall(staging)
+            # Prefer the platform's native multi-threaded copier (robocopy /
+            # cp); it pipelines the per-file open/stat syscalls far better
+            # than a Python copy loop
+            elif self._fast_copytree(str(backup_path_obj), str(staging)):
+                # The description file is backup bookkeeping, not save data
+                try:
+                    (staging / ".backup_description").unlink()
+                except OSError:
+                    pass
+            else:
+                # The native copier may have died part-way (robocopy error
+                # code, cp hitting an unreadable file) and left staging
+                # half-populated; start the fallback from a clean tree so
+                # copytree doesn't trip over directories that already exist
+                self._safe_rmtree(str(staging))
+                staging.mkdir()
+
+                files_restored = 0
+                # DirEntry.is_dir uses the d_type cached from the directory
+                # read, avoiding a stat per entry
+                with os.scandir(backup_path) as it:
+                    items = [item for item in it if item.name != ".backup_description"]
+
+                # One counting pass serves double duty: it yields the
+                # progress total and the per-entry file counts, so copied
+                # directories are not traversed a second time afterwards
+                entry_counts = {}
+                for item in items:
+                    if item.is_dir(follow_symlinks=False):
+                        entry_counts[item.path] = sum(1 for _ in _scan_tree(item.path))
+                    else:
+                        entry_counts[item.path] = 1
+                files_to_restore = sum(entry_counts.values())
+
+                def _restore_one(entry):
+                    dest = staging / entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        shutil.copytree(entry.path, dest, copy_function=_copy2_or_large)
+                    else:
+                        _copy2_or_large(entry.path, dest)
+                    return entry_counts[entry.path]
+
+                # Top-level items (profiles, characters, ...) are independent,
+                # so copy them in parallel; the GIL is released during file I/O
+                max_workers = min(16, (os.cpu_count() or 1) * 2)
+                # Only redraw the bar every ~1% of progress; per-file
+                # updates on an SSD are dominated by stdout flushes, not
+                # the copies themselves
+                progress_step = max(1, files_to_restore // 100)
+                with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    futures = [executor.submit(_restore_one, item) for item in items]
+                    for done in concurrent.futures.as_completed(futures):
+                        files_restored += done.result()
+                        if files_restored % progress_step == 0 or files_restored >= files_to_restore:
+                            show_progress(files_restored, files_to_restore, "Restoring")
+
+                print()  # New line after progress bar
+
+            # Swap: move the managed entries across, retire the old tree,
+            # promote the staged one. Each step is a constant-time rename.
+            os.rename(self.save_dir, old_dir)
+            moved = []
+            try:
+                for name in preserved:
+                    src_entry = old_dir / name
+                    dst_entry = staging / name
+                    # The backup may carry its own copy of a preserved entry
+                    # (the script file, for one); the live entry wins. Files
+                    # are replaced atomically; a colliding directory has to
+                    # be cleared first since rename won't overwrite it.
+                    if src_entry.is_dir() and not src_entry.is_symlink():
+                        if dst_entry.exists():
+                            self._safe_rmtree(str(dst_entry))
+                        os.rename(src_entry, dst_entry)
+                    else:
+                        os.replace(src_entry, dst_entry)
+                    moved.append(name)
+                os.rename(staging, self.save_dir)
+            except OSError:
+                # Put the original tree back before reporting failure,
+                # starting with the preserved entries already moved into
+                # staging — the next restore's leftover sweep deletes
+                # staging wholesale, so nothing precious may stay behind
+                for name in moved:
+                    try:
+                        os.replace(staging / name, old_dir / name)
+                    except OSError:
+                        pass
+                if not self.save_dir.exists():
+                    os.rename(old_dir, self.save_dir)
+                raise
+
+            # The old tree is dead weight now; delete it in the background
+            def _discard_old_tree(path=str(old_dir)):
+                try:
+                    self._safe_rmtree(path)
+                except Exception:
+                    pass  # leftover .old dirs are swept on the next restore
+
+            threading.Thread(target=_discard_old_tree, daemon=True).start()
+
             print_success(f"Backup '{backup_name}' restored successfully!")
             #if current_backup:
             #    print_info(f"Previous state backed up as: {current_backup.name}")
             return True
-            
+
         except Exception as e:
             print_error(f"Failed to restore backup: {e}")
             return False
@@ -913,7 +1715,7 @@ class SaveBackupManager:
                 return False
             backup_path = backups[backup_choice - 1]
         
-        backup_name = Path(backup_path).name
+        backup_name = backup_path.name
         
         # Show backup info
         print_header("Delete Backup")
@@ -928,6 +1730,7 @@ class SaveBackupManager:
         
         try:
             self._safe_rmtree(backup_path)
+            self._backup_list_cache = None
             print_success(f"Backup '{backup_name}' deleted successfully!")
             return True
         except Exception as e:
@@ -955,10 +1758,11 @@ class SaveBackupManager:
         for backup_path in backups_to_delete:
             try:
                 self._safe_rmtree(backup_path)
-                backup_name = Path(backup_path).name
+                backup_name = backup_path.name
                 print_success(f"Deleted: {backup_name}")
             except Exception as e:
                 print_error(f"Failed to delete {backup_path}: {e}")
+        self._backup_list_cache = None
 
 def get_user_input_with_prompt(prompt: str, default: Optional[str] = None) -> str:
     """Get user input with colored prompt"""
@@ -983,9 +1787,38 @@ def monitor_config_file(config_path: Path, callback_func):
     """Monitor config file for changes and call callback when modified"""
     if not config_path.exists():
         return
-    
+
     last_modified = config_path.stat().st_mtime
-    
+
+    if _WatchdogObserver is not None:
+        # Event-driven path: the observer thread blocks in the OS
+        # notification API and makes zero syscalls while the file is
+        # untouched, instead of stat()ing it once a second forever.
+        class _ConfigChangeHandler(_FileSystemEventHandler):
+            def on_any_event(self, event):
+                # Atomic-rename saves (vim, VS Code, save_games_config's
+                # own tmp + os.replace) surface as moved/created rather
+                # than modified, so react to any event touching the file
+                nonlocal last_modified
+                if (event.src_path != str(config_path)
+                        and getattr(event, 'dest_path', None) != str(config_path)):
+                    return
+                try:
+                    current_modified = config_path.stat().st_mtime
+                except OSError:
+                    return
+                # Editors can fire several events per save; dedupe on mtime
+                if current_modified != last_modified:
+                    last_modified = current_modified
+                    print_info("Config file changed - reloading...")
+                    callback_func()
+
+        observer = _WatchdogObserver()
+        observer.daemon = True
+        observer.schedule(_ConfigChangeHandler(), str(config_path.parent))
+        observer.start()
+        return observer
+
     def monitor_loop():
         nonlocal last_modified
         while True:
@@ -1004,6 +1837,57 @@ def monitor_config_file(config_path: Path, callback_func):
     monitor_thread.start()
     return monitor_thread
 
+def run_config_menu(config_path: Path, config: Dict[str, Any]) -> Dict[str, Any]:
+    """Run the game configuration menu and return the (possibly reloaded) config"""
+    while True:
+        print_header("Game Configuration Manager")
+        print_colored("1. 📋 List games", Colors.BLUE)
+        print_colored("2. ➕ Add game", Colors.GREEN)
+        print_colored("3. ✏️  Edit game", Colors.YELLOW)
+        print_colored("4. 🗑️  Remove game", Colors.RED)
+        print_colored("5. 📝 Open config in Notepad", Colors.MAGENTA)
+        print_colored("6. 🚪 Back to main menu", Colors.WHITE)
+
+        choice = input(f"\n{Colors.CYAN}Enter your choice (1-6): {Colors.END}").strip()
+
+        if choice == "1":
+            games = list_games(config)
+            if games:
+                print_header("Configured Games")
+                for i, (game_id, game_info) in enumerate(games, 1):
+                    name = game_info.get("name", game_id)
+                    save_path = game_info.get("save_path", "Unknown")
+                    backup_path = game_info.get("backup_path", "")
+                    description = game_info.get("description", "")
+
+                    print_colored(f"{i:2d}. {name} (ID: {game_id})", Colors.WHITE, bold=True)
+                    print_colored(f"    📁 Save: {save_path}", Colors.BLUE)
+                    if backup_path:
+                        print_colored(f"    💾 Backup: {backup_path}", Colors.GREEN)
+                    if description:
+                        print_colored(f"    📝 {description}", Colors.MAGENTA)
+            else:
+                print_warning("No games configured.")
+        elif choice == "2":
+            add_game_to_config(config_path, config)
+            config = load_games_config(config_path)  # Reload
+        elif choice == "3":
+            edit_game_config(config_path, config)
+            config = load_games_config(config_path)  # Reload
+        elif choice == "4":
+            remove_game_from_config(config_path, config)
+            config = load_games_config(config_path)  # Reload
+        elif choice == "5":
+            open_config_in_notepad(config_path)
+            print_info("Tip: The config file will be automatically reloaded when you save changes in Notepad")
+        elif choice == "6":
+            return config
+        else:
+            print_error("Invalid choice. Please enter 1-6.")
+
+        if choice in ["1", "2", "3", "4", "5"]:
+            input(f"\n{Colors.CYAN}Press Enter to continue...{Colors.END}")
+
 def main():
     parser = argparse.ArgumentParser(
         description="🎮 Save Game Backup Manager - Keep your saves safe!",
@@ -1042,7 +1926,7 @@ Examples:
     print_header("🎮 Save Game Backup Manager")
     
     # Load config file
-    config_path = Path(__file__).parent / "games_config.json"
+    config_path = _SCRIPT_DIR / "games_config.json"
     config = load_games_config(config_path)
     
     # Set up config file monitoring
@@ -1050,6 +1934,8 @@ Examples:
         nonlocal config
         try:
             config = load_games_config(config_path)
+            # Config paths may have changed; drop memoized expansions
+            expand_path.cache_clear()
         except Exception as e:
             print_error(f"Failed to reload config: {e}")
     
@@ -1058,54 +1944,7 @@ Examples:
     
     # Handle config management
     if args.config:
-        while True:
-            print_header("Game Configuration Manager")
-            print_colored("1. 📋 List games", Colors.BLUE)
-            print_colored("2. ➕ Add game", Colors.GREEN)
-            print_colored("3. ✏️  Edit game", Colors.YELLOW)
-            print_colored("4. 🗑️  Remove game", Colors.RED)
-            print_colored("5. � Open config in Notepad", Colors.MAGENTA)
-            print_colored("6. �🚪 Back to main menu", Colors.WHITE)
-            
-            choice = input(f"\n{Colors.CYAN}Enter your choice (1-6): {Colors.END}").strip()
-            
-            if choice == "1":
-                games = list_games(config)
-                if games:
-                    print_header("Configured Games")
-                    for i, (game_id, game_info) in enumerate(games, 1):
-                        name = game_info.get("name", game_id)
-                        save_path = game_info.get("save_path", "Unknown")
-                        backup_path = game_info.get("backup_path", "")
-                        description = game_info.get("description", "")
-                        
-                        print_colored(f"{i:2d}. {name} (ID: {game_id})", Colors.WHITE, bold=True)
-                        print_colored(f"    📁 Save: {save_path}", Colors.BLUE)
-                        if backup_path:
-                            print_colored(f"    💾 Backup: {backup_path}", Colors.GREEN)
-                        if description:
-                            print_colored(f"    📝 {description}", Colors.MAGENTA)
-                else:
-                    print_warning("No games configured.")
-            elif choice == "2":
-                add_game_to_config(config_path, config)
-                config = load_games_config(config_path)  # Reload
-            elif choice == "3":
-                edit_game_config(config_path, config)
-                config = load_games_config(config_path)  # Reload
-            elif choice == "4":
-                remove_game_from_config(config_path, config)
-                config = load_games_config(config_path)  # Reload
-            elif choice == "5":
-                open_config_in_notepad(config_path)
-                print_info("Tip: The config file will be automatically reloaded when you save changes in Notepad")
-            elif choice == "6":
-                break
-            else:
-                print_error("Invalid choice. Please enter 1-6.")
-            
-            if choice in ["1", "2", "3", "4", "5"]:
-                input(f"\n{Colors.CYAN}Press Enter to continue...{Colors.END}")
+        config = run_config_menu(config_path, config)
     
     # Determine save directory and game info
     save_dir = args.save_dir
@@ -1149,7 +1988,7 @@ Examples:
     # Ensure we standardize to using './backups' (plural) as the default backup
     # directory next to the script if none was provided.
     try:
-        script_dir = Path(__file__).parent
+        script_dir = _SCRIPT_DIR
         if not backup_dir:
             default_backup_dir = script_dir / "backups"
             # If the default doesn't exist yet, create it (non-fatal)
@@ -1194,35 +2033,68 @@ Examples:
         elif args.cleanup:
             manager.cleanup_backups(args.keep)
         elif not args.config:
-            # Interactive mode
+            # Interactive mode. Besides the numbered menu, compact commands
+            # (b [desc] / l / r N / d N / c [keep] / g / cfg / q) run without
+            # re-rendering the ~12-line menu, so back-to-back operations
+            # aren't dominated by redraw output.
+            command_aliases = {"b": "1", "l": "2", "r": "3", "d": "4",
+                               "c": "5", "g": "6", "cfg": "7", "q": "8"}
+            show_menu = True
             while True:
-                print_header("Main Menu")
-                if game_name:
-                    print_colored(f"🎮 Current Game: ", Colors.CYAN, bold=True, end="")
-                    print_colored(f"{game_name}\n", Colors.WHITE, bold=True)
-                print_colored("1. 💾 Create backup", Colors.GREEN)
-                print_colored("2. 📋 List backups", Colors.BLUE)
-                print_colored("3. 🔄 Restore backup", Colors.YELLOW)
-                print_colored("4. 🗑️ Delete backup", Colors.RED)
-                print_colored("5. 🧹 Cleanup old backups", Colors.MAGENTA)
-                print_colored("6. 🎮 Switch game", Colors.CYAN)
-                print_colored("7. ⚙️ Manage games config", Colors.WHITE)
-                print_colored("8. 🚪 Exit", Colors.WHITE)
-                
+                if show_menu:
+                    print_header("Main Menu")
+                    if game_name:
+                        print_colored(f"🎮 Current Game: ", Colors.CYAN, bold=True, end="")
+                        print_colored(f"{game_name}\n", Colors.WHITE, bold=True)
+                    print_colored("1. 💾 Create backup        (b [desc])", Colors.GREEN)
+                    print_colored("2. 📋 List backups         (l)", Colors.BLUE)
+                    print_colored("3. 🔄 Restore backup       (r [n])", Colors.YELLOW)
+                    print_colored("4. 🗑️ Delete backup        (d [n])", Colors.RED)
+                    print_colored("5. 🧹 Cleanup old backups  (c [keep])", Colors.MAGENTA)
+                    print_colored("6. 🎮 Switch game          (g)", Colors.CYAN)
+                    print_colored("7. ⚙️ Manage games config  (cfg)", Colors.WHITE)
+                    print_colored("8. 🚪 Exit                 (q)", Colors.WHITE)
+
                 try:
-                    choice = input(f"\n{Colors.CYAN}Enter your choice (1-8): {Colors.END}").strip()
-                    
+                    raw = input(f"\n{Colors.CYAN}Enter your choice (1-8) or command: {Colors.END}").strip()
+                    parts = raw.split(maxsplit=1)
+                    cmd = parts[0].lower() if parts else ""
+                    cmd_arg = parts[1].strip() if len(parts) > 1 else None
+                    compact = cmd in command_aliases
+                    choice = command_aliases[cmd] if compact else raw
+                    # Compact commands skip the menu reprint and the pause;
+                    # numbered choices keep the classic full-menu flow
+                    show_menu = not compact
+
                     if choice == "1":
-                        description = get_user_input_with_prompt("Backup description (optional)")
+                        if compact:
+                            description = cmd_arg or ""
+                        else:
+                            description = get_user_input_with_prompt("Backup description (optional)")
                         manager.create_backup(description if description else None)
                     elif choice == "2":
                         manager.list_backups()
                     elif choice == "3":
-                        manager.restore_backup()
+                        if compact and cmd_arg:
+                            try:
+                                manager.restore_backup(int(cmd_arg))
+                            except ValueError:
+                                print_error("Invalid backup number.")
+                        else:
+                            manager.restore_backup()
                     elif choice == "4":
-                        manager.delete_backup()
+                        if compact and cmd_arg:
+                            try:
+                                manager.delete_backup(int(cmd_arg))
+                            except ValueError:
+                                print_error("Invalid backup number.")
+                        else:
+                            manager.delete_backup()
                     elif choice == "5":
-                        keep_count = get_user_input_with_prompt("Number of backups to keep", str(manager.max_backups))
+                        if compact and cmd_arg:
+                            keep_count = cmd_arg
+                        else:
+                            keep_count = get_user_input_with_prompt("Number of backups to keep", str(manager.max_backups))
                         try:
                             keep_count = int(keep_count)
                             manager.cleanup_backups(keep_count)
@@ -1250,68 +2122,22 @@ Examples:
                                 print_error(f"Save directory does not exist: {new_save_dir}")
                     elif choice == "7":
                         # Jump to config management
-                        while True:
-                            print_header("Game Configuration Manager")
-                            print_colored("1. 📋 List games", Colors.BLUE)
-                            print_colored("2. ➕ Add game", Colors.GREEN)
-                            print_colored("3. ✏️  Edit game", Colors.YELLOW)
-                            print_colored("4. 🗑️  Remove game", Colors.RED)
-                            print_colored("5. 📝 Open config in Notepad", Colors.MAGENTA)
-                            print_colored("6. 🚪 Back to main menu", Colors.WHITE)
-                            
-                            config_choice = input(f"\n{Colors.CYAN}Enter your choice (1-6): {Colors.END}").strip()
-                            
-                            if config_choice == "1":
-                                games = list_games(config)
-                                if games:
-                                    print_header("Configured Games")
-                                    for i, (game_id, game_info) in enumerate(games, 1):
-                                        name = game_info.get("name", game_id)
-                                        save_path = game_info.get("save_path", "Unknown")
-                                        backup_path = game_info.get("backup_path", "")
-                                        description = game_info.get("description", "")
-                                        
-                                        print_colored(f"{i:2d}. {name} (ID: {game_id})", Colors.WHITE, bold=True)
-                                        print_colored(f"    📁 Save: {save_path}", Colors.BLUE)
-                                        if backup_path:
-                                            print_colored(f"    💾 Backup: {backup_path}", Colors.GREEN)
-                                        if description:
-                                            print_colored(f"    📝 {description}", Colors.MAGENTA)
-                                else:
-                                    print_warning("No games configured.")
-                            elif config_choice == "2":
-                                add_game_to_config(config_path, config)
-                                config = load_games_config(config_path)  # Reload
-                            elif config_choice == "3":
-                                edit_game_config(config_path, config)
-                                config = load_games_config(config_path)  # Reload
-                            elif config_choice == "4":
-                                remove_game_from_config(config_path, config)
-                                config = load_games_config(config_path)  # Reload
-                            elif config_choice == "5":
-                                open_config_in_notepad(config_path)
-                                print_info("Tip: The config file will be automatically reloaded when you save changes in Notepad")
-                            elif config_choice == "6":
-                                break
-                            else:
-                                print_error("Invalid choice. Please enter 1-6.")
-                            
-                            if config_choice in ["1", "2", "3", "4", "5"]:
-                                input(f"\n{Colors.CYAN}Press Enter to continue...{Colors.END}")
+                        config = run_config_menu(config_path, config)
                     elif choice == "8":
                         print_success("Thanks for using Save Game Backup Manager! 👋")
                         break
                     else:
                         print_error("Invalid choice. Please enter 1-8.")
-                        
+                        show_menu = True
+
                 except KeyboardInterrupt:
                     print_success("\nThanks for using Save Game Backup Manager! 👋")
                     break
                 except Exception as e:
                     print_error(f"An error occurred: {e}")
-                
+
                 # Pause before showing menu again
-                if choice not in ["7", "8"]:
+                if show_menu and choice not in ["7", "8"]:
                     input(f"\n{Colors.CYAN}Press Enter to continue...{Colors.END}")
                 
     except KeyboardInterrupt:
@@ -6,28 +6,39 @@ A terminal user interface for the backup.py CLI tool using Textual
 
 import os
 import sys
+import copy
+import json
 import threading
-import datetime
+import time
+import concurrent.futures
 from pathlib import Path
 from typing import Optional, Dict, Any, List, Text
-import asyncio
 
 from rich.text import Text
 
 from textual.app import App, ComposeResult
 from textual.containers import Container, Horizontal, Vertical
 from textual.widgets import (
-    Header, Footer, Button, Select, Static, Input, TextArea, 
+    Header, Footer, Button, Select, Static, Input, Switch, TextArea, 
     DataTable, Label,
     TabbedContent, TabPane
 )
 from textual.binding import Binding
 from textual.message import Message
 from textual.screen import ModalScreen
-from textual import on
+from textual import events, on
 from textual.validation import Number
 from textual.reactive import reactive
 
+# Optional watchdog support, mirroring backup.py: when present, the backup
+# directory is watched for changes and the polling auto-refresh stays idle.
+try:
+    from watchdog.observers import Observer as _WatchdogObserver
+    from watchdog.events import FileSystemEventHandler as _FileSystemEventHandler
+except ImportError:
+    _WatchdogObserver = None
+    _FileSystemEventHandler = object
+
 # Import the CLI functionality
 from backup import (
     SaveBackupManager, 
@@ -69,6 +80,15 @@ class ConfirmDialog(ModalScreen[bool]):
             classes="dialog"
         )
     
+    def set_message(self, message: str):
+        """Swap the prompt text so a cached dialog can be shown again."""
+        self.message = message
+        try:
+            self.query_one(".dialog-message", Static).update(message)
+        except Exception:
+            # Not mounted yet; compose will pick up self.message
+            pass
+
     @on(Button.Pressed, "#confirm")
     def on_confirm(self):
         self.dismiss(True)
@@ -217,18 +237,21 @@ class GameConfigDialog(ModalScreen[Optional[tuple]]):
             self.notify("Save path is required", severity="error")
             return
 
-        result = (game_id, {
+        game_info = {
             "name": name,
             "save_path": save_path,
             "backup_path": backup_path,
             "description": description,
-            # Only set overrides if provided
-            **({"skip_locked_files": True} if game_skip_locked_val == "true" else ({"skip_locked_files": False} if game_skip_locked_val == "false" else {})),
-            **({"copy_retries": int(game_copy_retries_val)} if game_copy_retries_val else {}),
-            **({"retry_delay": float(game_retry_delay_val)} if game_retry_delay_val else {})
-        })
+        }
+        # Only set overrides if provided
+        if game_skip_locked_val in ("true", "false"):
+            game_info["skip_locked_files"] = game_skip_locked_val == "true"
+        if game_copy_retries_val:
+            game_info["copy_retries"] = int(game_copy_retries_val)
+        if game_retry_delay_val:
+            game_info["retry_delay"] = float(game_retry_delay_val)
 
-        self.dismiss(result)
+        self.dismiss((game_id, game_info))
     
     @on(Button.Pressed, "#cancel")
     def on_cancel(self):
@@ -244,33 +267,88 @@ class BackupManagerApp(App):
         Binding("r", "restore_backup", "Restore Selected"),
         Binding("c", "create_backup", "Create Backup"),
         Binding("x", "delete_backup", "Delete Backup"),
-        Binding("1", "select_backup(1)", "Select Backup 1", show=False),
-        Binding("2", "select_backup(2)", "Select Backup 2", show=False),
-        Binding("3", "select_backup(3)", "Select Backup 3", show=False),
-        Binding("4", "select_backup(4)", "Select Backup 4", show=False),
-        Binding("5", "select_backup(5)", "Select Backup 5", show=False),
-        Binding("6", "select_backup(6)", "Select Backup 6", show=False),
-        Binding("7", "select_backup(7)", "Select Backup 7", show=False),
-        Binding("8", "select_backup(8)", "Select Backup 8", show=False),
-        Binding("9", "select_backup(9)", "Select Backup 9", show=False),
-        Binding("0", "select_backup(10)", "Select Backup 10", show=False),
+        Binding("space", "toggle_select_backup", "Mark", show=False),
     ]
+    # Digit keys 1-9 and 0 select backups 1-10; handled in on_key rather
+    # than ten separate bindings so every keypress scans a shorter table
     
     def __init__(self):
         super().__init__()
         self.title = "🎮 Save Game Backup Manager 🎮 "
         self.sub_title = ""
 
-        # Load configuration
+        # Configuration is loaded lazily in on_mount so construction stays
+        # cheap and any disk I/O happens after the terminal is handed over
         self.config_path = Path(__file__).parent / "games_config.json"
-        self.config = load_games_config(self.config_path)
+        self.config = {}
 
         # Current state
         self.manager = None
         self.current_game_id = None
         self.current_game_info = None
-        # Auto-refresh task handle
-        self._auto_refresh_task = None
+        # Auto-refresh timer handle
+        self._auto_refresh_timer = None
+        # Debounce timer coalescing rapid config edits into one write
+        self._config_save_timer = None
+        # (enabled, minutes) the auto-refresh timer currently reflects
+        self._auto_refresh_current = (False, None)
+        # Backup-dir mtime at the last refresh; idle timer ticks bail out
+        # without touching the worker pool when it hasn't moved
+        self._last_backup_dir_mtime_ns = 0
+        # Shared pool for background work (refresh, backup, restore);
+        # two workers let a refresh proceed alongside one mutating action
+        # while still serializing concurrent backup/restore attempts
+        self._worker_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="backup-mgr")
+        # Event-driven backup-dir watcher (when watchdog is installed)
+        self._backup_observer = None
+        self._watch_refresh_timer = None
+        # Per-backup caches keyed on the backup dir's mtime_ns, so refreshes
+        # of unchanged backups cost one stat instead of a full size walk
+        # and a description read: {path: (mtime_ns, value)}
+        self._size_cache: Dict[str, tuple] = {}
+        self._desc_cache: Dict[str, tuple] = {}
+        # The caches are persisted between runs so cold starts don't
+        # re-walk every backup directory
+        self._cache_file = Path.home() / ".cache" / "save-game-backup-manager" / "cache.json"
+        self._cache_dirty = False
+        # Set while a background refresh is collecting rows, so overlapping
+        # refresh requests (button + auto-refresh) coalesce into one
+        self._refresh_in_progress = threading.Event()
+        # Configuration tab is populated on first activation
+        self._config_tab_loaded = False
+        # Incremental games-table state: game_id -> row key, and the row
+        # tuples last painted, so config edits patch rows instead of
+        # rebuilding the whole table
+        self._game_row_keys: Dict[str, Any] = {}
+        self._last_game_rows: Dict[str, tuple] = {}
+        self._games_column_keys = []
+        # Reusable confirmation dialogs, keyed by (title, yes, no); only
+        # the message changes between showings of the same dialog
+        self._confirm_dialogs: Dict[tuple, ConfirmDialog] = {}
+        # Row indices marked with space for batch deletion
+        self._selected_rows: set = set()
+        # Cap on rendered backup rows; a "show more" row extends it on
+        # demand so size walks scale with the screen, not the backup count
+        self._visible_row_cap = 50
+        self._hidden_backup_count = 0
+        self._show_more_key = None
+        # Debounced last-selected-game persistence
+        self._last_game_flush_timer = None
+        self._last_game_dirty = False
+        # Last rendered backup rows plus their table keys, used to diff
+        # refreshes instead of clearing and re-adding an unchanged table
+        self._last_backup_rows = None
+        self._last_hidden_count = 0
+        self._backup_row_keys = []
+        self._backup_column_keys = []
+        # Only 11 distinct position labels ever exist ("1".."9", "0", "");
+        # building them once avoids a styled Text allocation per row
+        self._row_labels = [
+            Text(str(i + 1) if i < 9 else ("0" if i == 9 else ""),
+                 style="#B0FC38 italic")
+            for i in range(11)
+        ]
     
     def compose(self) -> ComposeResult:
         yield Header()
@@ -354,11 +432,9 @@ class BackupManagerApp(App):
                     ),
                     Horizontal(
                         Label("Skip locked files:"),
-                        Select(
-                            options=[("False", "false"), ("True", "true")],
-                            id="skip_locked",
-                            prompt="Skip locked files?",
-                            compact=True
+                        Switch(
+                            value=False,
+                            id="skip_locked"
                         ),
                         classes="setting-row"
                     ),
@@ -385,11 +461,9 @@ class BackupManagerApp(App):
                     ),
                     Horizontal(
                         Label("Auto-refresh:"),
-                        Select(
-                            options=[("Disabled", "false"), ("Enabled", "true")],
-                            id="auto_refresh_enabled",
-                            prompt="Enable automatic refresh",
-                            compact=True
+                        Switch(
+                            value=True,
+                            id="auto_refresh_enabled"
                         ),
                         Label("Interval (min):"),
                         Input(
@@ -409,23 +483,49 @@ class BackupManagerApp(App):
     
     def on_mount(self):
         """Initialize the application on mount."""
+        # Resolve frequently used widgets once; query_one walks the DOM
+        # with CSS matching on every call, which adds up in input handlers
+        self._backup_table = self.query_one("#backup_table", DataTable)
+        self._games_table = self.query_one("#games_table", DataTable)
+        self._game_select = self.query_one("#game_select", Select)
+        self._game_info = self.query_one("#game_info", Static)
+        self._backup_desc = self.query_one("#backup_description", Input)
+
         # Setup table columns
-        backup_table = self.query_one("#backup_table", DataTable)
-        backup_table.add_columns("Backup Name", "Date", "Time", "Age", "Size", "Description")
-        backup_table.cursor_type = "row"
-        
-        games_table = self.query_one("#games_table", DataTable)
-        games_table.add_columns("Game ID", "Name", "Save Path", "Backup Path", "Description")
-        games_table.cursor_type = "row"
+        self._backup_column_keys = list(self._backup_table.add_columns(
+            "Backup Name", "Date", "Time", "Age", "Size", "Description"))
+        self._backup_table.cursor_type = "row"
+
+        self._games_column_keys = list(self._games_table.add_columns(
+            "Game ID", "Name", "Save Path", "Backup Path", "Description"))
+        self._games_table.cursor_type = "row"
     
-        # Load data
+        # Load data. The Configuration tab (games table and settings
+        # widgets) is populated lazily the first time it is opened
+        self._load_disk_cache()
+        self.config = load_games_config(self.config_path)
         self.update_game_list()
-        self.update_games_table()
-        self.load_settings()
-    
+
+        # Auto-refresh doesn't need the settings widgets, so start it here
+        # rather than waiting for the Config tab to be opened
+        settings = self.config.get("settings", {})
+        if settings.get("auto_refresh_enabled", True):
+            try:
+                self.start_auto_refresh(int(settings.get("auto_refresh_interval", 5) or 5))
+            except Exception:
+                pass
+
+    @on(TabbedContent.TabActivated)
+    def on_tab_activated(self, event: TabbedContent.TabActivated):
+        """Populate the Configuration tab on first open."""
+        if event.pane.id == "config_tab" and not self._config_tab_loaded:
+            self._config_tab_loaded = True
+            self._sync_games_table()
+            self.load_settings()
+
     def update_game_list(self):
         """Update the game selection dropdown."""
-        select = self.query_one("#game_select", Select)
+        select = self._game_select
         games = list_games(self.config)
         
         if games:
@@ -464,20 +564,79 @@ class BackupManagerApp(App):
             self.manager = None
             self.update_game_info()
             # Clear backup list
-            table = self.query_one("#backup_table", DataTable)
+            table = self._backup_table
             table.clear()
+            self._last_backup_rows = None
+            self._last_hidden_count = 0
+            self._show_more_key = None
+            self._backup_row_keys = []
     
     def save_last_selected_game(self, game_id: str):
-        """Save the last selected game to configuration."""
+        """Remember the last selected game; the disk write is debounced.
+
+        Arrow-key navigation through the Select fires a change per step;
+        the in-memory config updates immediately but the JSON rewrite only
+        happens once the selection has been stable for a second.
+        """
         try:
             if "settings" not in self.config:
                 self.config["settings"] = {}
-            
+
             self.config["settings"]["last_selected_game"] = game_id
-            save_games_config(self.config_path, self.config)
-        except Exception as e:
+            self._last_game_dirty = True
+            if self._last_game_flush_timer is not None:
+                self._last_game_flush_timer.stop()
+            self._last_game_flush_timer = self.set_timer(
+                1.0, self._flush_last_selected_game)
+        except Exception:
             # Don't show error to user, just log it silently
             pass
+
+    def _schedule_save(self):
+        """Coalesce rapid config edits into one write 250 ms after the last."""
+        if self._config_save_timer is not None:
+            self._config_save_timer.stop()
+        self._config_save_timer = self.set_timer(0.25, self._flush_config_save)
+
+    def _flush_config_save(self):
+        self._config_save_timer = None
+        self._save_config_async()
+
+    def _save_config_async(self):
+        """Write the config from a worker thread so the UI never blocks.
+
+        The snapshot is taken here, on the UI thread, so edits made while
+        the worker is writing can't tear the file; save_games_config
+        itself writes atomically via a temp file and os.replace.
+        """
+        snapshot = copy.deepcopy(self.config)
+        self.run_worker(
+            lambda: save_games_config(self.config_path, snapshot),
+            thread=True, exclusive=False, group="config_save")
+
+    def _flush_last_selected_game(self):
+        """Write the pending last-selected-game change to disk."""
+        self._last_game_flush_timer = None
+        if not self._last_game_dirty:
+            return
+        try:
+            save_games_config(self.config_path, self.config)
+            self._last_game_dirty = False
+        except Exception:
+            pass
+
+    def on_unmount(self):
+        """Flush pending state and stop watchers before the app goes away."""
+        self._flush_last_selected_game()
+        if self._config_save_timer is not None:
+            # A debounced save is still pending; write it out synchronously
+            # since workers won't survive shutdown
+            self._config_save_timer.stop()
+            self._config_save_timer = None
+            save_games_config(self.config_path, self.config)
+        self._stop_backup_watch()
+        self._save_disk_cache()
+        self._worker_pool.shutdown(wait=False)
     
     def get_last_selected_game(self) -> str | None:
         """Get the last selected game from configuration."""
@@ -485,7 +644,7 @@ class BackupManagerApp(App):
     
     def update_game_info(self):
         """Update the game information display."""
-        info_widget = self.query_one("#game_info", Static)
+        info_widget = self._game_info
         
         if not self.current_game_info:
             info_widget.update("")
@@ -506,116 +665,325 @@ class BackupManagerApp(App):
             return
         
         try:
-            game_config = self.current_game_info.copy()
-            
+            game_config = self.current_game_info
+
             # Use default backup path if not specified
-            if not game_config.get("backup_path"):
+            backup_path = game_config.get("backup_path")
+            if not backup_path:
                 default_backup_path = self.config.get("settings", {}).get("default_backup_path", "")
                 if default_backup_path and self.current_game_id:
-                    game_config["backup_path"] = os.path.join(default_backup_path, str(self.current_game_id))
-            
+                    backup_path = os.path.join(default_backup_path, str(self.current_game_id))
+
             # Get max backups setting
-            max_backups = self.config.get("settings", {}).get("default_max_backups", 10)
-            # Read locking and retry settings
             settings = self.config.get("settings", {})
+            max_backups = settings.get("default_max_backups", 10)
+            # Read locking and retry settings
             skip_locked = settings.get("skip_locked_files", False)
             copy_retries = settings.get("copy_retries", 3)
             retry_delay = settings.get("retry_delay", 0.5)
 
             self.manager = SaveBackupManager(
                 save_dir=game_config["save_path"],
-                backup_dir=game_config.get("backup_path"),
+                backup_dir=backup_path,
                 max_backups=max_backups,
                 game_name=self.current_game_info.get("name"),
                 skip_locked_files=skip_locked,
                 retries=copy_retries,
                 retry_delay=retry_delay
             )
-            
+            self._start_backup_watch()
+            self._last_backup_dir_mtime_ns = 0
+
         except Exception as e:
             self.notify(f"Failed to initialize backup manager: {e}", severity="error")
             self.manager = None
     
-    def refresh_backup_list(self):
-        """Refresh the backup list display."""
-        table = self.query_one("#backup_table", DataTable)
-        table.clear()
-        
+    def _confirm(self, title: str, message: str, confirm_text: str,
+                 cancel_text: str, callback):
+        """Show a cached ConfirmDialog instead of building a new one."""
+        key = (title, confirm_text, cancel_text)
+        dialog = self._confirm_dialogs.get(key)
+        if dialog is None:
+            dialog = ConfirmDialog(title, message, confirm_text, cancel_text)
+            self._confirm_dialogs[key] = dialog
+        else:
+            dialog.set_message(message)
+        self.push_screen(dialog, callback)
+
+    def refresh_backup_list(self, force: bool = False):
+        """Refresh the backup list display.
+
+        All filesystem work happens in a background thread (like
+        action_create_backup); only the table mutation runs on the UI thread,
+        so slow disks and network drives don't freeze the interface.
+        Periodic timer ticks pass force=False and are dropped outright
+        when the backup directory's mtime hasn't changed since the last
+        refresh; anything that knows better passes force=True.
+        """
         if not self.manager:
+            table = self._backup_table
+            table.clear()
+            self._last_backup_rows = None
+            self._last_hidden_count = 0
+            self._show_more_key = None
+            self._backup_row_keys = []
             return
-        
+
         try:
-            backups = self.manager._get_backup_list()
-            
-            for index, backup_path in enumerate(backups):
-                backup_path_obj = Path(backup_path)
-                backup_name = backup_path_obj.name            
-                               
-                # Parse timestamp from backup name
-                try:
-                    timestamp_str = backup_name.replace("backup_", "")
-                    timestamp = datetime.datetime.strptime(timestamp_str, "%Y%m%d_%H%M%S")
-                    date_str = timestamp.strftime("%Y-%m-%d")
-                    time_str = timestamp.strftime("%H:%M:%S")
-                    
-                    # Calculate age
-                    age = datetime.datetime.now() - timestamp
-                    if age.days > 0:
-                        age_str = f"{age.days}d ago"
-                    elif age.seconds > 3600:
-                        hours = age.seconds // 3600
-                        age_str = f"{hours}h ago"
-                    else:
-                        minutes = age.seconds // 60
-                        age_str = f"{minutes}m ago"
-                        
-                except ValueError:
-                    date_str = "Unknown"
-                    time_str = "Unknown"
-                    age_str = "Unknown"
-                
-                # Get size
-                try:
-                    size = get_directory_size(backup_path_obj)
-                    size_str = format_file_size(size)
-                except Exception:
-                    size_str = "Unknown"
-                
-                # Get description
-                desc_file = backup_path_obj / ".backup_description"
-                description = ""
-                if desc_file.exists():
-                    try:
-                        description = desc_file.read_text(encoding='utf-8').strip()
-                    except Exception:
-                        pass
-
-
-                 # Add position number for first 10 backups in separate column
-                if index < 9:
-                    position = str(index + 1)
-                elif index == 9:
-                    position = "0"
-                else:
-                    position = ""
-                label = Text(str(position), style="#B0FC38 italic")  # type: ignore
-
-                # Add row to table
-                table.add_row(backup_name, date_str, time_str, age_str, size_str, description,
-                              label=label)
-            
-            # Set focus to first backup if available
-            if len(backups) > 0:
-                # Use call_after_refresh to ensure the table is fully rendered
-                self.call_after_refresh(self._set_backup_focus)
-        
-        except Exception as e:
-            self.notify(f"Failed to refresh backup list: {e}", severity="error")
-    
+            dir_mtime = os.stat(self.manager.backup_dir).st_mtime_ns
+        except OSError:
+            dir_mtime = 0
+        if not force and dir_mtime and dir_mtime == self._last_backup_dir_mtime_ns:
+            return
+
+        # A collection is already running; it will repaint when done
+        if self._refresh_in_progress.is_set():
+            return
+        self._refresh_in_progress.set()
+
+        def refresh_worker():
+            try:
+                rows = self._collect_backup_rows()
+                self.call_from_thread(self._apply_backup_rows, rows)
+                self._last_backup_dir_mtime_ns = dir_mtime
+                self._save_disk_cache()
+            except Exception as e:
+                self.call_from_thread(
+                    self.notify, f"Failed to refresh backup list: {e}",
+                    severity="error")
+            finally:
+                self._refresh_in_progress.clear()
+
+        self._worker_pool.submit(refresh_worker)
+
+    def _collect_backup_rows(self) -> List[tuple]:
+        """Gather one display tuple per backup (pure I/O, no UI access)."""
+        if not self.manager:
+            return []
+
+        backups = self.manager._get_backup_list()
+        # Only collect what will actually be rendered; hidden entries cost
+        # a size walk and a description read each for nothing
+        self._hidden_backup_count = max(0, len(backups) - self._visible_row_cap)
+        backups = backups[:self._visible_row_cap]
+        if not backups:
+            return []
+
+        # One clock read per refresh, shared by every row's age column
+        now_ts = time.time()
+
+        # Cold-path size walks are I/O latency bound and independent per
+        # backup, so fan them out; map preserves listing order
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+            rows = list(executor.map(
+                lambda path: self._collect_one_row(path, now_ts), backups))
+
+        # Drop cache entries for backups that no longer exist
+        live = {str(p) for p in backups}
+        for cache in (self._size_cache, self._desc_cache):
+            for stale in [k for k in cache if k not in live]:
+                del cache[stale]
+
+        return rows
+
+    # At most this many backups are remembered across runs
+    _DISK_CACHE_LIMIT = 1000
+
+    def _load_disk_cache(self):
+        """Seed the size/description caches from the sidecar cache file."""
+        try:
+            stored = json.loads(self._cache_file.read_text(encoding='utf-8'))
+            for key, (mtime_ns, size, description) in stored.items():
+                self._size_cache[key] = (mtime_ns, size)
+                self._desc_cache[key] = (mtime_ns, description)
+        except Exception:
+            # Missing or corrupt cache just means a cold start
+            pass
+
+    def _save_disk_cache(self):
+        """Write the caches back to disk if anything changed (best-effort)."""
+        if not self._cache_dirty:
+            return
+        self._cache_dirty = False
+        try:
+            stored = {}
+            for key, (mtime_ns, size) in self._size_cache.items():
+                desc_entry = self._desc_cache.get(key)
+                description = desc_entry[1] if desc_entry and desc_entry[0] == mtime_ns else ""
+                stored[key] = (mtime_ns, size, description)
+            if len(stored) > self._DISK_CACHE_LIMIT:
+                # Dict order is insertion order; keep the newest entries
+                stored = dict(list(stored.items())[-self._DISK_CACHE_LIMIT:])
+            self._cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self._cache_file.with_name(self._cache_file.name + '.tmp')
+            tmp_path.write_text(json.dumps(stored), encoding='utf-8')
+            os.replace(tmp_path, self._cache_file)
+        except Exception:
+            pass
+
+    _AGE_UNITS = ((86400, "d"), (3600, "h"), (60, "m"))
+
+    def _collect_one_row(self, backup_path: Path, now_ts: float) -> tuple:
+        """Build the display tuple for a single backup directory."""
+        backup_name = backup_path.name
+
+        # Parse the backup_YYYYMMDD_HHMMSS name directly; strptime re-parses
+        # its format string on every call and is several times slower
+        try:
+            s = backup_name.replace("backup_", "")
+            # mktime interprets the tuple as local time, matching how the
+            # backup names are generated; -1 lets it resolve DST itself
+            backup_ts = time.mktime((
+                int(s[0:4]), int(s[4:6]), int(s[6:8]),
+                int(s[9:11]), int(s[11:13]), int(s[13:15]), 0, 0, -1))
+            date_str = f"{s[0:4]}-{s[4:6]}-{s[6:8]}"
+            time_str = f"{s[9:11]}:{s[11:13]}:{s[13:15]}"
+
+            # Age as a plain integer-seconds diff, via a unit table
+            secs = int(now_ts - backup_ts)
+            age_str = "0m ago"
+            for threshold, unit in self._AGE_UNITS:
+                if secs >= threshold:
+                    age_str = f"{secs // threshold}{unit} ago"
+                    break
+
+        except (ValueError, IndexError, OverflowError):
+            date_str = "Unknown"
+            time_str = "Unknown"
+            age_str = "Unknown"
+
+        # Get size (cached: backups are immutable, so the dir
+        # mtime only changes if the backup itself is replaced)
+        key = str(backup_path)
+        try:
+            # The listing scan already recorded each backup's mtime; only
+            # stat again if this path somehow wasn't in the last scan
+            dir_mtime = self.manager._backup_mtimes.get(key) if self.manager else None
+            if dir_mtime is None:
+                dir_mtime = backup_path.stat().st_mtime_ns
+            cached = self._size_cache.get(key)
+            if cached and cached[0] == dir_mtime:
+                size = cached[1]
+            else:
+                size = get_directory_size(backup_path)
+                self._size_cache[key] = (dir_mtime, size)
+                self._cache_dirty = True
+            size_str = format_file_size(size)
+        except Exception:
+            dir_mtime = None
+            size_str = "Unknown"
+
+        # Get description (same mtime-keyed cache)
+        cached = self._desc_cache.get(key)
+        if cached and dir_mtime is not None and cached[0] == dir_mtime:
+            description = cached[1]
+        else:
+            description = ""
+            try:
+                # Bounded read: the column is truncated for display, so
+                # never slurp an oversized description file
+                with open(backup_path / ".backup_description", 'rb') as f:
+                    description = f.read(256).decode('utf-8', errors='replace').strip()
+            except Exception:
+                pass
+            if dir_mtime is not None:
+                self._desc_cache[key] = (dir_mtime, description)
+                self._cache_dirty = True
+
+        return (backup_name, date_str, time_str, age_str, size_str, description)
+
+    def _apply_backup_rows(self, rows: List[tuple]):
+        """Update the backup table from collected rows (UI thread only).
+
+        An unchanged list is a no-op; if only cell values changed (the age
+        column ticks over on every auto-refresh), the cells are updated in
+        place, which also keeps the cursor where the user left it. Only
+        additions/removals — which renumber the position labels anyway —
+        trigger a full repaint.
+        """
+        hidden = self._hidden_backup_count
+        if rows == self._last_backup_rows and hidden == self._last_hidden_count:
+            return
+
+        table = self._backup_table
+
+        old = self._last_backup_rows
+        if (hidden == self._last_hidden_count
+                and old is not None and len(old) == len(rows)
+                and all(o[0] == n[0] for o, n in zip(old, rows))):
+            self._clear_backup_selection()
+            for o, n, row_key in zip(old, rows, self._backup_row_keys):
+                for col_idx, (old_val, new_val) in enumerate(zip(o, n)):
+                    if old_val != new_val:
+                        table.update_cell(row_key,
+                                          self._backup_column_keys[col_idx],
+                                          new_val, update_width=True)
+            self._last_backup_rows = rows
+            return
+
+        table.clear()
+        self._backup_row_keys = []
+        self._selected_rows.clear()
+
+        for index, row in enumerate(rows):
+            # Position label for the first 10 backups (reused, not rebuilt;
+            # DataTable doesn't mutate the label object)
+            label = self._row_labels[min(index, 10)]
+
+            self._backup_row_keys.append(table.add_row(*row, label=label))
+
+        if hidden:
+            self._show_more_key = table.add_row(
+                f"… show {hidden} more (Enter)", "", "", "", "", "")
+        else:
+            self._show_more_key = None
+        self._last_hidden_count = hidden
+        self._last_backup_rows = rows
+
+        # Set focus to first backup if available
+        if rows:
+            # Use call_after_refresh to ensure the table is fully rendered
+            self.call_after_refresh(self._set_backup_focus)
+
+    def _clear_backup_selection(self):
+        """Unmark any space-selected rows and empty the selection set."""
+        for index in self._selected_rows:
+            if index < len(self._backup_row_keys) and self._last_backup_rows:
+                self._backup_table.update_cell(
+                    self._backup_row_keys[index], self._backup_column_keys[0],
+                    self._last_backup_rows[index][0], update_width=True)
+        self._selected_rows.clear()
+
+    def action_toggle_select_backup(self):
+        """Toggle batch-delete selection on the row under the cursor."""
+        table = self._backup_table
+        index = table.cursor_row
+        if (not self.manager or index is None
+                or index >= len(self._backup_row_keys)
+                or not self._last_backup_rows):
+            return
+        name = self._last_backup_rows[index][0]
+        if index in self._selected_rows:
+            self._selected_rows.discard(index)
+            display = name
+        else:
+            self._selected_rows.add(index)
+            display = f"✓ {name}"
+        table.update_cell(self._backup_row_keys[index],
+                          self._backup_column_keys[0], display,
+                          update_width=True)
+
+    @on(DataTable.RowSelected, "#backup_table")
+    def on_backup_row_selected(self, event: DataTable.RowSelected):
+        """Extend the render cap when the "show more" row is activated."""
+        if self._show_more_key is not None and event.row_key == self._show_more_key:
+            self._visible_row_cap += 50
+            self.refresh_backup_list(force=True)
+
     def _set_backup_focus(self):
         """Set focus to the first backup in the table."""
         try:
-            table = self.query_one("#backup_table", DataTable)
+            table = self._backup_table
             if table.row_count > 0:
                 table.move_cursor(row=0, column=0)
                 table.focus()
@@ -624,13 +992,13 @@ class BackupManagerApp(App):
             pass
     
     @on(Button.Pressed, "#create_backup")
-    def on_create_backup(self):
+    def action_create_backup(self):
         """Create a new backup."""
         if not self.manager:
             self.notify("No game selected", severity="error")
             return
         
-        description_input = self.query_one("#backup_description", Input)
+        description_input = self._backup_desc
         description = description_input.value.strip() or None
         
         def backup_worker():
@@ -642,8 +1010,7 @@ class BackupManagerApp(App):
             except Exception as e:
                 self.call_from_thread(self.on_backup_error, str(e))
         
-        thread = threading.Thread(target=backup_worker, daemon=True)
-        thread.start()
+        self._worker_pool.submit(backup_worker)
     
     def on_backup_complete(self, result: bool, description_input: Input):
         """Handle backup completion."""
@@ -651,7 +1018,7 @@ class BackupManagerApp(App):
         if result:
             self.notify("Backup created successfully!", severity="information")
             description_input.value = ""
-            self.refresh_backup_list()
+            self.refresh_backup_list(force=True)
         else:
             self.notify("Failed to create backup", severity="error")
     
@@ -660,11 +1027,11 @@ class BackupManagerApp(App):
         self.notify(f"Backup failed: {error}", severity="error")
     
     @on(Button.Pressed, "#restore_backup")
-    def on_restore_backup(self):
+    def action_restore_backup(self):
         """Restore the selected backup."""
-        table = self.query_one("#backup_table", DataTable)
+        table = self._backup_table
         
-        if table.cursor_row is None or table.cursor_row >= table.row_count:
+        if table.cursor_row is None or table.cursor_row >= len(self._backup_row_keys):
             self.notify("Please select a backup to restore", severity="warning")
             return
         
@@ -681,13 +1048,10 @@ class BackupManagerApp(App):
             if confirmed:
                 self.perform_restore(backup_name, table.cursor_row)
         
-        self.push_screen(
-            ConfirmDialog(
-                "Confirm Restore",
-                f"This will overwrite your current save files with '{backup_name}'.\n\nAre you sure you want to continue?",
-                "Restore",
-                "Cancel"
-            ),
+        self._confirm(
+            "Confirm Restore",
+            f"This will overwrite your current save files with '{backup_name}'.\n\nAre you sure you want to continue?",
+            "Restore", "Cancel",
             handle_restore_confirmation
         )
     
@@ -706,8 +1070,7 @@ class BackupManagerApp(App):
             except Exception as e:
                 self.call_from_thread(self.on_restore_error, str(e))
         
-        thread = threading.Thread(target=restore_worker, daemon=True)
-        thread.start()
+        self._worker_pool.submit(restore_worker)
     
     def on_restore_complete(self, success: bool):
         """Handle restore completion."""
@@ -721,11 +1084,31 @@ class BackupManagerApp(App):
         self.notify(f"Restore failed: {error}", severity="error")
     
     @on(Button.Pressed, "#delete_backup")
-    def on_delete_backup(self):
-        """Delete the selected backup."""
-        table = self.query_one("#backup_table", DataTable)
-        
-        if table.cursor_row is None or table.cursor_row >= table.row_count:
+    def action_delete_backup(self):
+        """Delete the selected backup(s)."""
+        table = self._backup_table
+
+        # Space-marked rows take precedence: delete them as one batch with
+        # a single confirmation and a single refresh at the end
+        if self._selected_rows:
+            if not self.manager:
+                self.notify("No game selected", severity="error")
+                return
+            indices = sorted(self._selected_rows, reverse=True)
+
+            def handle_batch_confirmation(confirmed: bool | None):
+                if confirmed:
+                    self.perform_batch_delete(indices)
+
+            self._confirm(
+                "Confirm Delete",
+                f"Are you sure you want to delete {len(indices)} selected backup(s)?\n\nThis action cannot be undone.",
+                "Delete", "Cancel",
+                handle_batch_confirmation
+            )
+            return
+
+        if table.cursor_row is None or table.cursor_row >= len(self._backup_row_keys):
             self.notify("Please select a backup to delete", severity="warning")
             return
         
@@ -742,13 +1125,10 @@ class BackupManagerApp(App):
             if confirmed:
                 self.perform_delete(backup_name, table.cursor_row)
         
-        self.push_screen(
-            ConfirmDialog(
-                "Confirm Delete",
-                f"Are you sure you want to delete backup '{backup_name}'?\n\nThis action cannot be undone.",
-                "Delete",
-                "Cancel"
-            ),
+        self._confirm(
+            "Confirm Delete",
+            f"Are you sure you want to delete backup '{backup_name}'?\n\nThis action cannot be undone.",
+            "Delete", "Cancel",
             handle_delete_confirmation
         )
     
@@ -764,13 +1144,36 @@ class BackupManagerApp(App):
             
             if success:
                 self.notify("Backup deleted successfully!", severity="information")
-                self.refresh_backup_list()
+                self.refresh_backup_list(force=True)
             else:
                 self.notify("Failed to delete backup", severity="error")
                 
         except Exception as e:
             self.notify(f"Delete failed: {e}", severity="error")
     
+    def perform_batch_delete(self, indices: List[int]):
+        """Delete the given row indices (descending), then refresh once."""
+        if not self.manager:
+            self.notify("No backup manager available", severity="error")
+            return
+
+        deleted = 0
+        try:
+            # Descending order keeps the remaining 1-based indices valid
+            # as later entries are removed
+            for index in indices:
+                if self.manager.delete_backup(index + 1, skip_confirmation=True):
+                    deleted += 1
+        except Exception as e:
+            self.notify(f"Delete failed: {e}", severity="error")
+
+        self._selected_rows.clear()
+        if deleted:
+            self.notify(f"Deleted {deleted} backup(s)", severity="information")
+            self.refresh_backup_list(force=True)
+        else:
+            self.notify("Failed to delete selected backups", severity="error")
+
     @on(Button.Pressed, "#cleanup_backups")
     def on_cleanup_backups(self):
         """Cleanup old backups."""
@@ -783,13 +1186,10 @@ class BackupManagerApp(App):
             if confirmed:
                 self.perform_cleanup()
         
-        self.push_screen(
-            ConfirmDialog(
-                "Confirm Cleanup",
-                f"This will remove old backups beyond the configured limit.\n\nContinue?",
-                "Cleanup",
-                "Cancel"
-            ),
+        self._confirm(
+            "Confirm Cleanup",
+            f"This will remove old backups beyond the configured limit.\n\nContinue?",
+            "Cleanup", "Cancel",
             handle_cleanup_confirmation
         )
     
@@ -800,15 +1200,14 @@ class BackupManagerApp(App):
             return
             
         try:
-            # Call the private cleanup method
-            initial_count = len(self.manager._get_backup_list())
-            self.manager._cleanup_old_backups()
-            final_count = len(self.manager._get_backup_list())
-            removed_count = initial_count - final_count
-            
+            # The cleanup reports its own removal count, so there's no need
+            # to snapshot the listing before and after
+            removed_count = self.manager._cleanup_old_backups()
+
+
             if removed_count > 0:
                 self.notify(f"Cleaned up {removed_count} old backup(s)", severity="information")
-                self.refresh_backup_list()
+                self.refresh_backup_list(force=True)
             else:
                 self.notify("No old backups to clean up", severity="information")
                 
@@ -818,22 +1217,49 @@ class BackupManagerApp(App):
     @on(Button.Pressed, "#refresh_backups")
     def on_refresh_backups(self):
         """Refresh the backup list."""
-        self.refresh_backup_list()
+        self.refresh_backup_list(force=True)
     
-    def update_games_table(self):
-        """Update the games configuration table."""
-        table = self.query_one("#games_table", DataTable)
-        table.clear()
-        
+    def _sync_games_table(self):
+        """Bring the games table in line with the config incrementally.
+
+        A single add/edit/remove touches one row, so diff against the rows
+        last painted and issue targeted add_row/update_cell/remove_row
+        calls instead of clearing and rebuilding the whole table.
+        """
+        table = self._games_table
+
         games = self.config.get("games", {})
-        
-        for game_id, game_info in games.items():
-            name = game_info.get("name", "")
-            save_path = game_info.get("save_path", "")
-            backup_path = game_info.get("backup_path", "Default")
-            description = game_info.get("description", "")
-            
-            table.add_row(game_id, name, save_path, backup_path, description)
+        new_rows = {
+            game_id: (game_id,
+                      game_info.get("name", ""),
+                      game_info.get("save_path", ""),
+                      game_info.get("backup_path", "Default"),
+                      game_info.get("description", ""))
+            for game_id, game_info in games.items()
+        }
+
+        # First population: one bulk add_rows call (single refresh) instead
+        # of a per-game add_row loop
+        if not self._last_game_rows:
+            keys = table.add_rows(new_rows.values())
+            self._game_row_keys = dict(zip(new_rows, keys))
+            self._last_game_rows = dict(new_rows)
+            return
+
+        for game_id in [gid for gid in self._last_game_rows if gid not in new_rows]:
+            table.remove_row(self._game_row_keys.pop(game_id))
+            del self._last_game_rows[game_id]
+
+        for game_id, row in new_rows.items():
+            old_row = self._last_game_rows.get(game_id)
+            if old_row is None:
+                self._game_row_keys[game_id] = table.add_row(*row)
+            elif old_row != row:
+                row_key = self._game_row_keys[game_id]
+                for col_key, old_val, new_val in zip(self._games_column_keys, old_row, row):
+                    if old_val != new_val:
+                        table.update_cell(row_key, col_key, new_val, update_width=True)
+            self._last_game_rows[game_id] = row
     
     @on(Button.Pressed, "#add_game")
     def on_add_game(self):
@@ -841,19 +1267,17 @@ class BackupManagerApp(App):
         def handle_add_game_result(result: tuple | None):
             if result:
                 game_id, game_info = result
-                
-                if game_id in self.config.get("games", {}):
+
+                games = self.config.setdefault("games", {})
+                if game_id in games:
                     self.notify(f"Game '{game_id}' already exists", severity="error")
                     return
-                
-                if "games" not in self.config:
-                    self.config["games"] = {}
-                
-                self.config["games"][game_id] = game_info
-                save_games_config(self.config_path, self.config)
+
+                games[game_id] = game_info
+                self._schedule_save()
                 
                 self.notify(f"Game '{game_info['name']}' added successfully!", severity="information")
-                self.update_games_table()
+                self._sync_games_table()
                 self.update_game_list()
         
         self.push_screen(
@@ -864,36 +1288,35 @@ class BackupManagerApp(App):
     @on(Button.Pressed, "#edit_game")
     def on_edit_game(self):
         """Edit the selected game configuration."""
-        table = self.query_one("#games_table", DataTable)
+        table = self._games_table
         
         if table.cursor_row is None or table.cursor_row >= table.row_count:
             self.notify("Please select a game to edit", severity="warning")
             return
         
         # Get selected game
+        games = self.config.setdefault("games", {})
         row_key = table.get_row_at(table.cursor_row)
         game_id = row_key[0]
-        game_info = self.config.get("games", {}).get(game_id, {})
-        
+        game_info = games.get(game_id, {})
+
         def handle_edit_game_result(result: tuple | None):
             if result:
                 new_game_id, new_game_info = result
-                
+
                 # If game ID changed, remove old and add new
                 if new_game_id != game_id:
-                    if new_game_id in self.config.get("games", {}):
+                    if new_game_id in games:
                         self.notify(f"Game '{new_game_id}' already exists", severity="error")
                         return
-                    
-                    del self.config["games"][game_id]
-                    self.config["games"][new_game_id] = new_game_info
-                else:
-                    self.config["games"][game_id] = new_game_info
-                
-                save_games_config(self.config_path, self.config)
+
+                    del games[game_id]
+                games[new_game_id] = new_game_info
+
+                self._schedule_save()
                 
                 self.notify(f"Game '{new_game_info['name']}' updated successfully!", severity="information")
-                self.update_games_table()
+                self._sync_games_table()
                 self.update_game_list()
         
         self.push_screen(
@@ -904,42 +1327,39 @@ class BackupManagerApp(App):
     @on(Button.Pressed, "#remove_game")
     def on_remove_game(self):
         """Remove the selected game configuration."""
-        table = self.query_one("#games_table", DataTable)
+        table = self._games_table
         
         if table.cursor_row is None or table.cursor_row >= table.row_count:
             self.notify("Please select a game to remove", severity="warning")
             return
         
         # Get selected game
+        games = self.config.setdefault("games", {})
         row_key = table.get_row_at(table.cursor_row)
         game_id = row_key[0]
-        game_info = self.config.get("games", {}).get(game_id, {})
-        game_name = game_info.get("name", game_id)
-        
+        game_name = games.get(game_id, {}).get("name", game_id)
+
         # Show confirmation dialog
         def handle_remove_confirmation(confirmed: bool | None):
             if confirmed:
-                del self.config["games"][game_id]
-                save_games_config(self.config_path, self.config)
+                del games[game_id]
+                self._schedule_save()
                 
                 self.notify(f"Game '{game_name}' removed successfully!", severity="information")
-                self.update_games_table()
+                self._sync_games_table()
                 self.update_game_list()
         
-        self.push_screen(
-            ConfirmDialog(
-                "Confirm Remove",
-                f"Are you sure you want to remove '{game_name}' from the configuration?",
-                "Remove",
-                "Cancel"
-            ),
+        self._confirm(
+            "Confirm Remove",
+            f"Are you sure you want to remove '{game_name}' from the configuration?",
+            "Remove", "Cancel",
             handle_remove_confirmation
         )
     
     @on(Button.Pressed, "#refresh_games")
     def on_refresh_games(self):
         """Refresh the games table."""
-        self.update_games_table()
+        self._sync_games_table()
     
     def load_settings(self):
         """Load global settings into the UI."""
@@ -952,9 +1372,8 @@ class BackupManagerApp(App):
         backup_path_input.value = settings.get("default_backup_path", "")
 
         # New settings
-        skip_locked_select = self.query_one("#skip_locked", Select)
-        skip_locked_val = settings.get("skip_locked_files", False)
-        skip_locked_select.value = "true" if skip_locked_val else "false"
+        skip_locked_switch = self.query_one("#skip_locked", Switch)
+        skip_locked_switch.value = bool(settings.get("skip_locked_files", False))
 
         copy_retries_input = self.query_one("#copy_retries", Input)
         copy_retries_input.value = str(settings.get("copy_retries", 3))
@@ -966,8 +1385,7 @@ class BackupManagerApp(App):
         auto_refresh_enabled = settings.get("auto_refresh_enabled", True)
         auto_refresh_interval = settings.get("auto_refresh_interval", 5)
 
-        auto_refresh_select = self.query_one("#auto_refresh_enabled", Select)
-        auto_refresh_select.value = "true" if auto_refresh_enabled else "false"
+        self.query_one("#auto_refresh_enabled", Switch).value = bool(auto_refresh_enabled)
 
         auto_refresh_interval_input = self.query_one("#auto_refresh_interval", Input)
         auto_refresh_interval_input.value = str(auto_refresh_interval)
@@ -992,8 +1410,7 @@ class BackupManagerApp(App):
             max_backups = int(max_backups_input.value) if max_backups_input.value else 10
             backup_path = backup_path_input.value.strip()
             # Read new settings
-            skip_locked_select = self.query_one("#skip_locked", Select)
-            skip_locked = True if (skip_locked_select.value == "true") else False
+            skip_locked = self.query_one("#skip_locked", Switch).value
 
             copy_retries = int(self.query_one("#copy_retries", Input).value or 3)
             try:
@@ -1010,14 +1427,13 @@ class BackupManagerApp(App):
             self.config["settings"]["copy_retries"] = copy_retries
             self.config["settings"]["retry_delay"] = retry_delay
             # Auto-refresh settings
-            auto_refresh_select = self.query_one("#auto_refresh_enabled", Select)
-            auto_refresh_enabled = True if (auto_refresh_select.value == "true") else False
+            auto_refresh_enabled = self.query_one("#auto_refresh_enabled", Switch).value
             auto_refresh_interval = int(self.query_one("#auto_refresh_interval", Input).value or 5)
 
             self.config["settings"]["auto_refresh_enabled"] = auto_refresh_enabled
             self.config["settings"]["auto_refresh_interval"] = auto_refresh_interval
             
-            save_games_config(self.config_path, self.config)
+            self._schedule_save()
             
             self.notify("Settings saved successfully!", severity="information")
             
@@ -1028,12 +1444,16 @@ class BackupManagerApp(App):
                 self.manager.skip_locked_files = skip_locked
                 self.manager.retries = copy_retries
                 self.manager.retry_delay = retry_delay
-            # Start/stop auto-refresh based on new settings
+            # Start/stop auto-refresh only when the settings actually
+            # changed; an unrelated settings save shouldn't reset the timer
             try:
-                if auto_refresh_enabled:
-                    self.start_auto_refresh(auto_refresh_interval)
-                else:
-                    self.stop_auto_refresh()
+                desired = (bool(auto_refresh_enabled),
+                           max(1, int(auto_refresh_interval)) if auto_refresh_enabled else None)
+                if desired != self._auto_refresh_current:
+                    if auto_refresh_enabled:
+                        self.start_auto_refresh(auto_refresh_interval)
+                    else:
+                        self.stop_auto_refresh()
             except Exception:
                 pass
             
@@ -1043,10 +1463,21 @@ class BackupManagerApp(App):
             self.notify(f"Failed to save settings: {e}", severity="error")
 
     
+    def on_key(self, event: events.Key):
+        """Dispatch bare digit keys to backup selection.
+
+        Inputs and other widgets consume printable keys before they bubble
+        here, so this only fires when no text field has focus.
+        """
+        ch = event.character
+        if ch and ch in "0123456789":
+            self.action_select_backup(10 if ch == "0" else int(ch))
+            event.stop()
+
     def action_select_backup(self, backup_number: int):
-        """Select a backup by number (1-9)."""
+        """Select a backup by number (1-10)."""
         try:
-            table = self.query_one("#backup_table", DataTable)
+            table = self._backup_table
             
             # Check if the backup exists (backup_number is 1-indexed)
             if backup_number > len(table.rows) or backup_number < 1:
@@ -1067,67 +1498,90 @@ class BackupManagerApp(App):
 
     def action_refresh(self):
         """Refresh current view."""
-        self.refresh_backup_list()
+        self.refresh_backup_list(force=True)
+
+    # Backup-directory watcher (event-driven refresh)
+    def _start_backup_watch(self):
+        """Watch the current backup directory and refresh on changes.
+
+        With watchdog installed the observer thread sleeps in the OS
+        notification API, so an idle backup directory costs nothing; the
+        interval-based auto-refresh then acts purely as a fallback.
+        """
+        self._stop_backup_watch()
+        if _WatchdogObserver is None or not self.manager:
+            return
+
+        app = self
+
+        class _BackupDirHandler(_FileSystemEventHandler):
+            def on_any_event(self, event):
+                app._schedule_watch_refresh()
 
-    # Auto-refresh helpers
-    def start_auto_refresh(self, minutes: int):
-        """Start the background auto-refresh task. Minutes must be >= 1."""
         try:
-            minutes = max(1, int(minutes))
+            observer = _WatchdogObserver()
+            observer.daemon = True
+            observer.schedule(_BackupDirHandler(), str(self.manager.backup_dir))
+            observer.start()
+            self._backup_observer = observer
+            # Events supersede the polling loop
+            self.stop_auto_refresh()
         except Exception:
-            minutes = 5
+            self._backup_observer = None
 
-        # If existing task running, cancel it first
-        if self._auto_refresh_task and not self._auto_refresh_task.done():
+    def _stop_backup_watch(self):
+        """Stop the backup-directory observer if running."""
+        if self._backup_observer is not None:
             try:
-                self._auto_refresh_task.cancel()
+                self._backup_observer.stop()
             except Exception:
                 pass
+            self._backup_observer = None
 
-        # Create asyncio task
-        loop = asyncio.get_event_loop()
-        self._auto_refresh_task = loop.create_task(self._auto_refresh_loop(minutes))
-
-    def stop_auto_refresh(self):
-        """Stop the background auto-refresh task if running."""
-        if self._auto_refresh_task and not self._auto_refresh_task.done():
-            try:
-                self._auto_refresh_task.cancel()
-            except Exception:
-                pass
-        self._auto_refresh_task = None
+    def _schedule_watch_refresh(self):
+        """Coalesce a burst of watcher events into one deferred refresh."""
+        def arm_timer():
+            if self._watch_refresh_timer is not None:
+                self._watch_refresh_timer.stop()
+            self._watch_refresh_timer = self.set_timer(0.5, self._watch_refresh)
 
-    async def _auto_refresh_loop(self, minutes: int):
-        """Async loop that refreshes backups every `minutes` minutes."""
         try:
-            while True:
-                # Wait for the configured interval (in seconds)
-                await asyncio.sleep(max(1, int(minutes)) * 60)
-                # Call refresh on the main thread/context
-                try:
-                    # Use call_from_thread to safely update UI if running in different thread
-                    self.call_from_thread(self.refresh_backup_list)
-                except Exception:
-                    # Fallback to direct call
-                    try:
-                        self.refresh_backup_list()
-                    except Exception:
-                        pass
-        except asyncio.CancelledError:
-            # Task was cancelled; just exit
+            # Observer callbacks run on the watchdog thread
+            self.call_from_thread(arm_timer)
+        except Exception:
+            pass
+
+    def _watch_refresh(self):
+        self._watch_refresh_timer = None
+        # Events can come from inside a backup subtree without bumping the
+        # backup dir's own mtime, so don't trust the staleness check here
+        self.refresh_backup_list(force=True)
+
+    # Auto-refresh helpers
+    def start_auto_refresh(self, minutes: int):
+        """Start the periodic auto-refresh timer. Minutes must be >= 1."""
+        # The filesystem watcher already triggers refreshes on change;
+        # don't also poll
+        if self._backup_observer is not None:
             return
+        try:
+            minutes = max(1, int(minutes))
+        except Exception:
+            minutes = 5
+
+        # Textual's interval timer runs on the app's own event loop, so
+        # there's no suspended coroutine or thread hop per tick
+        self.stop_auto_refresh()
+        self._auto_refresh_timer = self.set_interval(minutes * 60, self.refresh_backup_list)
+        self._auto_refresh_current = (True, minutes)
+
+    def stop_auto_refresh(self):
+        """Stop the auto-refresh timer if running."""
+        if self._auto_refresh_timer is not None:
+            self._auto_refresh_timer.stop()
+            self._auto_refresh_timer = None
+        self._auto_refresh_current = (False, None)
     
-    def action_create_backup(self):
-        """Create backup via keyboard shortcut."""
-        self.on_create_backup()
-    
-    def action_delete_backup(self):
-        """Delete backup via keyboard shortcut."""
-        self.on_delete_backup()
-    
-    def action_restore_backup(self):
-        """Restore backup via keyboard shortcut."""
-        self.on_restore_backup()
 
 
 def main():
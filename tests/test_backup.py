@@ -74,6 +74,33 @@ def test_create_backup_and_cleanup_and_description(tmp_path):
     assert desc.read_text(encoding='utf-8') in ("first", "second", "third")
 
 
+def test_unchanged_files_hardlinked_between_backups(tmp_path):
+    save_dir = tmp_path / "saves_dedup"
+    save_dir.mkdir()
+    (save_dir / "static.dat").write_text("unchanging")
+
+    backup_dir = tmp_path / "backups"
+    manager = backup.SaveBackupManager(save_dir, backup_dir, max_backups=5)
+
+    p1 = manager.create_backup("first")
+    assert p1 is not None
+    time.sleep(1)
+    # Add a new file but leave static.dat untouched
+    (save_dir / "changed.dat").write_text("new data")
+    p2 = manager.create_backup("second")
+    assert p2 is not None
+
+    # The unchanged file should share an inode with the previous backup copy
+    assert (p2 / "static.dat").stat().st_ino == (p1 / "static.dat").stat().st_ino
+    # The new file is a regular copy present only in the second backup
+    assert (p2 / "changed.dat").exists()
+    assert not (p1 / "changed.dat").exists()
+
+    # Metadata records the per-file index used for dedup
+    meta = json.loads((p2 / ".backup_meta.json").read_text(encoding='utf-8'))
+    assert "static.dat" in meta.get("file_entries", {})
+
+
 def test_restore_backup(tmp_path):
     # prepare save dir with old content
     save_dir = tmp_path / "save_dir"
@@ -110,19 +137,18 @@ def test_interrupted_backup_leaves_no_partial_and_metadata_on_success(tmp_path,
 
     manager = backup.SaveBackupManager(save_dir, backup_dir, max_backups=5)
 
-    # Monkeypatch shutil.copy2 to raise after a few copies to simulate interruption
-    import shutil as _shutil
-    original_copy2 = _shutil.copy2
+    # Monkeypatch the copy worker to raise after a few copies to simulate interruption
+    original_copy_and_hash = backup.SaveBackupManager._copy_and_hash
     counter = {"count": 0}
 
-    def failing_copy2(src, dst, follow_symlinks=True):
+    def failing_copy_and_hash(self, src, dst):
         counter["count"] += 1
         # allow first two files then fail to simulate crash
         if counter["count"] == 3:
             raise RuntimeError("simulated interruption")
-        return original_copy2(src, dst, follow_symlinks=follow_symlinks)
+        return original_copy_and_hash(self, src, dst)
 
-    monkeypatch.setattr("shutil.copy2", failing_copy2)
+    monkeypatch.setattr(backup.SaveBackupManager, "_copy_and_hash", failing_copy_and_hash)
 
     # Attempt backup; should handle exception and return None (failure)
     res = manager.create_backup("interrupted")
@@ -132,8 +158,8 @@ def test_interrupted_backup_leaves_no_partial_and_metadata_on_success(tmp_path,
     visible_backups = [p for p in backup_dir.iterdir() if p.is_dir() and not p.name.startswith('.')]
     assert len(visible_backups) == 0
 
-    # Now restore copy2 and perform a successful backup to verify metadata is written
-    monkeypatch.setattr("shutil.copy2", original_copy2)
+    # Now restore the copy worker and perform a successful backup to verify metadata is written
+    monkeypatch.setattr(backup.SaveBackupManager, "_copy_and_hash", original_copy_and_hash)
     success = manager.create_backup("final")
     assert success is not None
 
@@ -188,6 +214,74 @@ def test_exdev_fallback_moves_and_metadata_copied(tmp_path, monkeypatch):
 
 
 
+@pytest.mark.skipif(backup._zstd is None, reason="zstandard not installed")
+def test_archive_backup_round_trip_cross_fs(tmp_path, monkeypatch):
+    # Force the cross-filesystem branch by faking a different st_dev for the
+    # backup dir, so create_backup writes a data.tar.zst archive instead of
+    # a directory tree; then restore it and compare contents
+    save_dir = tmp_path / "saves_archive"
+    save_dir.mkdir()
+    (save_dir / "a.txt").write_text("alpha")
+    (save_dir / "sub").mkdir()
+    (save_dir / "sub" / "b.dat").write_text("beta")
+
+    backup_dir = tmp_path / "backups"
+    backup_dir.mkdir()
+
+    real_stat = os.stat
+
+    def fake_stat(path, *args, **kwargs):
+        st = real_stat(path, *args, **kwargs)
+        if isinstance(path, (str, os.PathLike)) and Path(path) == backup_dir:
+            return os.stat_result(
+                (st.st_mode, st.st_ino, st.st_dev + 1, st.st_nlink,
+                 st.st_uid, st.st_gid, st.st_size,
+                 st.st_atime, st.st_mtime, st.st_ctime))
+        return st
+
+    monkeypatch.setattr(backup.os, "stat", fake_stat)
+
+    manager = backup.SaveBackupManager(save_dir, backup_dir, max_backups=3)
+    result = manager.create_backup("cross-fs")
+    assert result is not None
+    # Archive format: a single tarball plus the usual bookkeeping files
+    assert (result / "data.tar.zst").exists()
+    assert not (result / "a.txt").exists()
+    meta = json.loads((result / ".backup_meta.json").read_text(encoding='utf-8'))
+    assert meta.get("format") == "tar-zst"
+
+    # Mangle the live save, then restore from the archive
+    (save_dir / "a.txt").write_text("clobbered")
+    shutil.rmtree(save_dir / "sub")
+    ok = manager.restore_backup(backup_choice=1, skip_confirmation=True)
+    assert ok is True
+    assert (save_dir / "a.txt").read_text() == "alpha"
+    assert (save_dir / "sub" / "b.dat").read_text() == "beta"
+
+
+def test_archive_restore_errors_without_zstandard(tmp_path, monkeypatch):
+    # An archive-format backup can't be restored when zstandard is missing;
+    # restore should report failure and clean up its staging dir
+    save_dir = tmp_path / "saves_no_zstd"
+    save_dir.mkdir()
+    (save_dir / "a.txt").write_text("keep me")
+
+    backup_dir = tmp_path / "backups"
+    backup_dir.mkdir()
+    bpath = backup_dir / "backup_20250101_000000"
+    bpath.mkdir()
+    (bpath / "data.tar.zst").write_bytes(b"not really an archive")
+
+    monkeypatch.setattr(backup, "_zstd", None)
+
+    manager = backup.SaveBackupManager(save_dir, backup_dir, max_backups=3)
+    ok = manager.restore_backup(backup_choice=1, skip_confirmation=True)
+    assert ok is False
+    # The live save is untouched and no staging dir is left behind
+    assert (save_dir / "a.txt").read_text() == "keep me"
+    assert not (tmp_path / "saves_no_zstd.restoring").exists()
+
+
 def test_move_failure_cleanup_on_exception(tmp_path, monkeypatch):
     # Simulate os.replace raising EXDEV and shutil.move also failing to ensure cleanup
     save_dir = tmp_path / "saves_move_fail"
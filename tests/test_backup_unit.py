@@ -15,25 +15,23 @@ def fake_mkdtemp(prefix: str | None = None, dir: str | None = None) -> str:
     return str(base_dir / (prefix_str + "TMP"))
 
 
-def test_create_backup_isolated_success(monkeypatch, fake_mkdtemp_func, fake_mkdir_func, write_text_capture, fake_walk_builder):
+def test_create_backup_isolated_success(monkeypatch, fake_mkdtemp_func, fake_mkdir_func, write_text_capture):
     # Fully isolated test: no filesystem operations should run
     # Prevent actual directory creation during manager init
     monkeypatch.setattr(backup.Path, "mkdir", fake_mkdir_func)
     manager = backup.SaveBackupManager("/fake/save_dir", "/fake/backups", max_backups=2)
 
-    # Fake os.walk to report two files in save_dir and in backup destination
-    nested = {"a.txt": None, "b.txt": None}
-    monkeypatch.setattr(backup.os, "walk", fake_walk_builder(Path("/fake/save_dir"), nested))
+    # Fake the scandir worklist to report two files in save_dir
+    monkeypatch.setattr(backup, "_build_copy_worklist",
+                        lambda src: ([], [("/fake/save_dir/a.txt", "a.txt"),
+                                          ("/fake/save_dir/b.txt", "b.txt")]))
+    # Fake the per-file copy worker so no real I/O happens
+    monkeypatch.setattr(backup.SaveBackupManager, "_copy_and_hash",
+                        lambda self, src, dst: b'\x00')
 
     # Fake mkdtemp to return a temp path string inside the fake backup dir
     monkeypatch.setattr(tempfile, "mkdtemp", fake_mkdtemp_func)
 
-    # Fake copytree to do nothing
-    def fake_copytree(src, dst, **kwargs):
-        return dst
-
-    monkeypatch.setattr(backup.shutil, "copytree", fake_copytree)
-
     # Fake os.replace to simulate atomic rename success
     def fake_replace(a, b):
         return None
@@ -41,7 +39,7 @@ def test_create_backup_isolated_success(monkeypatch, fake_mkdtemp_func, fake_mkd
     monkeypatch.setattr(backup.os, "replace", fake_replace)
 
     # Fake checksum and size
-    monkeypatch.setattr(backup, "compute_directory_sha256", lambda p: "deadbeef")
+    monkeypatch.setattr(backup, "compute_directory_checksum", lambda p: "deadbeef")
     monkeypatch.setattr(backup, "get_directory_size", lambda p: 1234)
 
     # Capture Path.write_text calls in-memory using fixture
@@ -59,16 +57,17 @@ def test_create_backup_isolated_success(monkeypatch, fake_mkdtemp_func, fake_mkd
     assert meta.get("move_method") == "atomic"
 
 
-def test_create_backup_isolated_exdev_and_move_called(monkeypatch, fake_mkdtemp_func, fake_mkdir_func, write_text_capture, fake_walk_builder):
+def test_create_backup_isolated_exdev_and_move_called(monkeypatch, fake_mkdtemp_func, fake_mkdir_func, write_text_capture):
     # Isolated test for EXDEV fallback that ensures shutil.move is called
     # Prevent actual directory creation during manager init
     monkeypatch.setattr(backup.Path, "mkdir", fake_mkdir_func)
     manager = backup.SaveBackupManager("/fake/save_dir", "/fake/backups", max_backups=2)
 
-    nested = {"a.txt": None}
-    monkeypatch.setattr(backup.os, "walk", fake_walk_builder(Path("/fake/save_dir"), nested))
+    monkeypatch.setattr(backup, "_build_copy_worklist",
+                        lambda src: ([], [("/fake/save_dir/a.txt", "a.txt")]))
+    monkeypatch.setattr(backup.SaveBackupManager, "_copy_and_hash",
+                        lambda self, src, dst: b'\x00')
     monkeypatch.setattr(tempfile, "mkdtemp", fake_mkdtemp_func)
-    monkeypatch.setattr(backup.shutil, "copytree", lambda src, dst, **kwargs: dst)
 
     # Make os.replace raise EXDEV
     def fake_replace(a, b):
@@ -86,7 +85,7 @@ def test_create_backup_isolated_exdev_and_move_called(monkeypatch, fake_mkdtemp_
 
     monkeypatch.setattr(backup.shutil, "move", fake_move)
 
-    monkeypatch.setattr(backup, "compute_directory_sha256", lambda p: "cafebabe")
+    monkeypatch.setattr(backup, "compute_directory_checksum", lambda p: "cafebabe")
     monkeypatch.setattr(backup, "get_directory_size", lambda p: 42)
 
     writes, fake_write_text = write_text_capture